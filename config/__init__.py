@@ -1,3 +1,11 @@
-from .settings import settings
+from .app_settings import Settings, get_settings
 
-__all__ = ["settings"]
+
+def __getattr__(name):
+    # ``settings`` is built on first access (PEP 562), so importing config does no work
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["settings", "get_settings", "Settings"]
@@ -0,0 +1,100 @@
+"""
+Configuration management for UW-Agent application.
+Uses pydantic-settings for environment variable management.
+"""
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Any, Literal, Mapping
+
+
+class Settings(BaseSettings):
+    """Application settings loaded from environment variables."""
+    
+    # OpenAI Configuration
+    openai_api_key: str
+    openai_model: str = "gpt-4o-mini"
+    openai_temperature: float = 0.7
+    
+    # ChromaDB Configuration
+    chroma_persist_directory: str = "./chroma_db"
+    chroma_collection_name: str = "underwriting_policies"
+    # Chunk ID hash; changing it re-IDs chunks, so reset the collection after switching
+    hash_algo: Literal["md5", "blake2b", "xxh3"] = "md5"
+    # HNSW index parameters; Chroma applies them only when a collection is created
+    chroma_hnsw_space: Literal["cosine", "l2", "ip"] = "cosine"
+    chroma_hnsw_search_ef: int = 32
+    chroma_hnsw_construction_ef: int = 100
+    chroma_hnsw_m: int = 16
+    
+    # Embedding Configuration
+    embedding_model: str = "text-embedding-3-small"
+    embedding_batch_size: int = 2048  # Texts per embeddings request (API maximum)
+    embedding_max_retries: int = 6
+    embedding_request_timeout: float = 30.0
+    query_embedding_cache_size: int = 1024  # Recent query embeddings kept per vector store
+    
+    # Application Configuration
+    app_name: str = "UW-Agent"
+    app_version: str = "0.1.0"
+    debug_mode: bool = False
+    log_level: str = "INFO"
+    
+    # Policy Configuration
+    structured_rules_path: str = "./policies/structured_rules.json"
+    policies_directory: str = "./policies"
+    rule_extraction_batch_size: int = 5  # Policies sent per LLM call during rule generation
+    rule_extraction_concurrency: int = 4  # Rule extraction LLM calls in flight at once
+    
+    # Agent Configuration
+    agent_timeout_seconds: int = 60
+    max_retries: int = 3
+    
+    # Mock API Configuration (for POC)
+    mock_api_delay_min: float = 0.5
+    mock_api_delay_max: float = 2.0
+    mock_api_success_rate: float = 0.8
+    
+    # Frozen: settings are read-only after startup, which keeps the cached
+    # config dicts valid and makes the instance hashable for lru_cache keys.
+    # Derive variants with settings.model_copy(update={...}) instead of assigning.
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+        frozen=True
+    )
+    
+    @cached_property
+    def openai_config(self) -> Mapping[str, Any]:
+        """Read-only OpenAI configuration, built once per settings instance."""
+        return MappingProxyType({
+            "api_key": self.openai_api_key,
+            "model": self.openai_model,
+            "temperature": self.openai_temperature
+        })
+    
+    @cached_property
+    def chroma_config(self) -> Mapping[str, Any]:
+        """Read-only ChromaDB configuration, built once per settings instance."""
+        return MappingProxyType({
+            "persist_directory": self.chroma_persist_directory,
+            "collection_name": self.chroma_collection_name
+        })
+    
+    def get_openai_config(self) -> dict:
+        """Get OpenAI configuration dictionary (a copy the caller may modify)."""
+        return dict(self.openai_config)
+    
+    def get_chroma_config(self) -> dict:
+        """Get ChromaDB configuration dictionary (a copy the caller may modify)."""
+        return dict(self.chroma_config)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the global settings instance, building it on first use."""
+    return Settings()
+
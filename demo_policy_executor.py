@@ -4,16 +4,12 @@ Demonstrates generating and using structured rules.
 """
 
 import sys
-import os
 from pathlib import Path
 import json
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from tools.vector_store import PolicyVectorStore
 from tools.policy_executor import PolicyExecutor
-from config import settings
+from config import get_settings
 
 
 def main():
@@ -25,6 +21,7 @@ def main():
     print()
     
     # Check for API key
+    settings = get_settings()
     if not settings.openai_api_key or settings.openai_api_key == "your_openai_api_key_here":
         print("❌ OpenAI API key not configured")
         print("   Please add your API key to the .env file")
@@ -134,7 +131,15 @@ def main():
         sample_rule = "IDENTITY_VERIFICATION"
         rule_data = structured_rules.get(sample_rule)
         if rule_data:
-            print(json.dumps(rule_data, indent=2)[:500] + "...")
+            # Encode incrementally and stop once the preview length is reached
+            preview = []
+            preview_len = 0
+            for chunk in json.JSONEncoder(indent=2).iterencode(rule_data):
+                preview.append(chunk)
+                preview_len += len(chunk)
+                if preview_len >= 500:
+                    break
+            print("".join(preview)[:500] + "...")
         print()
         
         print("=" * 70)
@@ -4,14 +4,10 @@ This demo requires an OpenAI API key to be set in .env file.
 """
 
 import sys
-import os
 from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from tools.vector_store import PolicyVectorStore
-from config import settings
+from config import get_settings
 
 
 def main():
@@ -23,6 +19,7 @@ def main():
     print()
     
     # Check for API key
+    settings = get_settings()
     if not settings.openai_api_key or settings.openai_api_key == "your_openai_api_key_here":
         print("⚠️  OpenAI API key not configured")
         print("   To run this demo, add your API key to the .env file:")
@@ -36,17 +33,21 @@ def main():
         if not policy_file.exists():
             policy_file = Path("policies/sample_policies.txt")
         
+        # Single streamed pass: count characters and collect rule names
+        total_chars = 0
+        rules = []
         with open(policy_file, 'r') as f:
-            content = f.read()
+            for line in f:
+                total_chars += len(line)
+                if line.startswith('REVIEW_RULE:'):
+                    rules.append(line[len('REVIEW_RULE:'):].strip())
         
-        print(f"✓ Policy file loaded: {len(content)} characters")
-        print(f"✓ Contains {content.count('REVIEW_RULE:')} review rules")
+        print(f"✓ Policy file loaded: {total_chars} characters")
+        print(f"✓ Contains {len(rules)} review rules")
         print()
         print("Review rules defined:")
-        for line in content.split('\n'):
-            if line.startswith('REVIEW_RULE:'):
-                rule = line.replace('REVIEW_RULE:', '').strip()
-                print(f"  • {rule}")
+        for rule in rules:
+            print(f"  • {rule}")
         print()
         
         # Show what would happen with API key
@@ -2,48 +2,89 @@
 Main entry point for UW-Agent application.
 """
 
-import argparse
 import logging
-from config import settings
+import sys
+from typing import Optional
+from config import get_settings
 
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, settings.log_level),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Flag-only commands that can be dispatched without building an argument parser
+QUICK_COMMANDS = {"--init", "--demo", "--regenerate-rules"}
+
+
+def _build_parser():
+    """Build the full argument parser (only needed for valued or unknown arguments)."""
+    import argparse
 
-def main():
-    """Main function."""
     parser = argparse.ArgumentParser(description="UW-Agent: AI-Powered Underwriting Assistant")
     parser.add_argument("--init", action="store_true", help="Initialize system and generate policy rules")
     parser.add_argument("--demo", action="store_true", help="Run demo with sample applications")
     parser.add_argument("--application", type=str, help="Process specific application ID")
     parser.add_argument("--regenerate-rules", action="store_true", help="Regenerate policy rules")
-    
-    args = parser.parse_args()
-    
+    return parser
+
+
+def _dispatch(command: str, application_id: Optional[str] = None) -> None:
+    """
+    Run a CLI command.
+
+    Args:
+        command: Command flag (e.g., "--init")
+        application_id: Application ID for the --application command
+    """
+    settings = get_settings()
     logger.info(f"Starting {settings.app_name} v{settings.app_version}")
-    
-    if args.init:
+
+    if command == "--init":
         logger.info("Initializing system...")
         # TODO: Implement initialization
         logger.info("System initialization will be implemented in Prompt 7")
-    elif args.demo:
+    elif command == "--demo":
         logger.info("Running demo mode...")
         # TODO: Implement demo
         logger.info("Demo mode will be implemented in Prompt 7")
-    elif args.application:
-        logger.info(f"Processing application: {args.application}")
+    elif command == "--application":
+        logger.info(f"Processing application: {application_id}")
         # TODO: Implement application processing
         logger.info("Application processing will be implemented in Prompt 7")
-    elif args.regenerate_rules:
+    elif command == "--regenerate-rules":
         logger.info("Regenerating policy rules...")
         # TODO: Implement rule regeneration
         logger.info("Rule regeneration will be implemented in Prompt 7")
+
+
+def main():
+    """Main function."""
+    settings = get_settings()
+
+    # Configure logging only when the CLI actually runs; basicConfig is a
+    # no-op if the root logger already has handlers
+    logging.basicConfig(
+        level=getattr(logging, settings.log_level, logging.INFO),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    argv = sys.argv[1:]
+
+    # Fast path: a single flag-only command skips argparse entirely
+    if len(argv) == 1 and argv[0] in QUICK_COMMANDS:
+        return _dispatch(argv[0])
+
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    if args.init:
+        _dispatch("--init")
+    elif args.demo:
+        _dispatch("--demo")
+    elif args.application:
+        _dispatch("--application", args.application)
+    elif args.regenerate_rules:
+        _dispatch("--regenerate-rules")
     else:
+        logger.info(f"Starting {settings.app_name} v{settings.app_version}")
         parser.print_help()
 
 
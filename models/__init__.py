@@ -2,16 +2,24 @@ from .application import (
     CreditApplication,
     UnderwritingDecision,
     AgentFinding,
+    FindingRecord,
+    FINDINGS_ADAPTER,
     RiskLevel,
     DecisionStatus,
-    FindingStatus
+    FindingStatus,
+    batch_timestamp,
+    summarize_findings
 )
 
 __all__ = [
     "CreditApplication",
     "UnderwritingDecision",
     "AgentFinding",
+    "FindingRecord",
+    "FINDINGS_ADAPTER",
     "RiskLevel",
     "DecisionStatus",
-    "FindingStatus"
+    "FindingStatus",
+    "batch_timestamp",
+    "summarize_findings"
 ]
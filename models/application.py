@@ -2,11 +2,61 @@
 Data models for credit card application and underwriting decisions.
 """
 
-from pydantic import BaseModel, Field
-from typing import List, Dict, Optional
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+from typing import Any, Iterable, Iterator, List, Dict, Optional, Union
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
+import json
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+# Timestamp shared by every model created inside a batch_timestamp() block
+_BATCH_NOW: ContextVar[Optional[datetime]] = ContextVar("batch_now", default=None)
+
+
+def _now() -> datetime:
+    """Default timestamp factory: the active batch timestamp, else the current time."""
+    batch_now = _BATCH_NOW.get()
+    return batch_now if batch_now is not None else datetime.now()
+
+
+@contextmanager
+def batch_timestamp(now: Optional[datetime] = None) -> Iterator[datetime]:
+    """
+    Stamp every finding/decision created in this block with one timestamp.
+    
+    Batch scoring creates many models per request; this reads the clock
+    once instead of once per model.
+    
+    Args:
+        now: Timestamp to use (defaults to the current time)
+        
+    Yields:
+        The batch timestamp
+    """
+    batch_now = now if now is not None else datetime.now()
+    token = _BATCH_NOW.set(batch_now)
+    try:
+        yield batch_now
+    finally:
+        _BATCH_NOW.reset(token)
+
 
 class RiskLevel(str, Enum):
     """Risk level classifications."""
@@ -48,10 +98,10 @@ class CreditApplication(BaseModel):
     existing_debt: Optional[float] = Field(None, description="Existing debt amount")
     
     # Metadata
-    submitted_at: datetime = Field(default_factory=datetime.now, description="Application submission timestamp")
+    submitted_at: datetime = Field(default_factory=_now, description="Application submission timestamp")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "application_id": "APP-12345",
                 "customer_name": "John Doe",
@@ -66,6 +116,17 @@ class CreditApplication(BaseModel):
                 "existing_debt": 15000.0
             }
         }
+    )
+    
+    @classmethod
+    def from_json(cls, raw: Union[str, bytes]) -> "CreditApplication":
+        """
+        Parse and validate an application from raw JSON in a single pass.
+        
+        Decoding and validation both run in pydantic-core, skipping the
+        intermediate Python dict of json.loads + CreditApplication(**data).
+        """
+        return cls.model_validate_json(raw)
 
 
 class AgentFinding(BaseModel):
@@ -78,10 +139,12 @@ class AgentFinding(BaseModel):
     risk_level: RiskLevel = Field(..., description="Risk level assessment")
     confidence: float = Field(..., description="Confidence score", ge=0, le=1)
     reasoning: str = Field(..., description="Explanation for the finding")
-    timestamp: datetime = Field(default_factory=datetime.now, description="When the finding was created")
+    timestamp: datetime = Field(default_factory=_now, description="When the finding was created")
     
-    class Config:
-        json_schema_extra = {
+    # Frozen: findings are immutable once created
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "agent_name": "IdentityAgent",
                 "check_type": "IDENTITY_VERIFICATION",
@@ -97,6 +160,105 @@ class AgentFinding(BaseModel):
                 "timestamp": "2026-01-28T10:30:00"
             }
         }
+    )
+    
+    @field_validator("details", mode="before")
+    @classmethod
+    def _decode_details(cls, value: Any) -> Any:
+        """
+        Accept details already serialized as JSON (e.g. a raw API response body).
+        
+        The JSON is decoded at construction, so ``details`` is always a dict.
+        """
+        if not isinstance(value, (bytes, bytearray, str)):
+            return value
+        try:
+            decoded = orjson.loads(value) if HAS_ORJSON else json.loads(value)
+        except ValueError:
+            raise ValueError("details must be a dict or a JSON object") from None
+        if not isinstance(decoded, dict):
+            raise ValueError(f"details JSON must be an object, got {type(decoded).__name__}")
+        return decoded
+    
+    @classmethod
+    def trusted(
+        cls,
+        agent_name: str,
+        check_type: str,
+        status: FindingStatus,
+        risk_level: RiskLevel,
+        confidence: float,
+        reasoning: str,
+        details: Optional[Dict[str, Any]] = None,
+        timestamp: Optional[datetime] = None
+    ) -> "AgentFinding":
+        """
+        Build a finding from agent-internal data without running validation.
+        
+        Only for findings produced by our own agent logic. Callers must pass
+        correctly typed values (enum members, 0-1 confidence); type checkers
+        catch drift at dev time. External input goes through the normal
+        constructor or model_validate_json.
+        
+        Args:
+            agent_name: Name of the producing agent
+            check_type: Type of check performed
+            status: Finding status
+            risk_level: Risk level assessment
+            confidence: Confidence score (0-1)
+            reasoning: Explanation for the finding
+            details: Detailed findings
+            timestamp: Creation time (defaults to now)
+            
+        Returns:
+            Unvalidated AgentFinding instance
+        """
+        return cls.model_construct(
+            agent_name=agent_name,
+            check_type=check_type,
+            status=status,
+            details=details if details is not None else {},
+            risk_level=risk_level,
+            confidence=confidence,
+            reasoning=reasoning,
+            timestamp=timestamp if timestamp is not None else _now()
+        )
+
+
+# Validates a whole list of findings in one pydantic-core call; built once at import
+FINDINGS_ADAPTER: TypeAdapter[List[AgentFinding]] = TypeAdapter(List[AgentFinding])
+
+
+@dataclass(slots=True)
+class FindingRecord:
+    """
+    Lightweight, slotted finding used on the internal agent hot path.
+    
+    Agents build these from already-typed data, so no validation runs on
+    construction. Convert with ``to_model()`` (or pass directly to
+    ``UnderwritingDecision.add_finding``) at the API boundary.
+    """
+    agent_name: str
+    check_type: str
+    status: FindingStatus
+    risk_level: RiskLevel
+    confidence: float
+    reasoning: str
+    details: Dict[str, Any] = field(default_factory=dict)
+    timestamp: datetime = field(default_factory=_now)
+    
+    def to_model(self) -> AgentFinding:
+        """Convert to an AgentFinding without re-validating trusted fields."""
+        return AgentFinding.trusted(
+            agent_name=self.agent_name,
+            check_type=self.check_type,
+            status=self.status,
+            details=self.details,
+            risk_level=self.risk_level,
+            confidence=self.confidence,
+            reasoning=self.reasoning,
+            timestamp=self.timestamp
+        )
 
 
 class UnderwritingDecision(BaseModel):
@@ -107,15 +269,15 @@ class UnderwritingDecision(BaseModel):
     confidence_score: float = Field(..., description="Confidence in the decision", ge=0, le=1)
     findings: List[AgentFinding] = Field(default_factory=list, description="All agent findings")
     reasoning: str = Field(..., description="Explanation for the decision")
-    timestamp: datetime = Field(default_factory=datetime.now, description="Decision timestamp")
+    timestamp: datetime = Field(default_factory=_now, description="Decision timestamp")
     
     # Additional metadata
     processing_time_seconds: Optional[float] = Field(None, description="Time taken to process")
     rules_applied: List[str] = Field(default_factory=list, description="Review rules that were applied")
     requires_manual_review: bool = Field(False, description="Whether manual review is needed")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "application_id": "APP-12345",
                 "decision": "APPROVED",
@@ -128,11 +290,31 @@ class UnderwritingDecision(BaseModel):
                 "requires_manual_review": False
             }
         }
+    )
     
-    def add_finding(self, finding: AgentFinding) -> None:
-        """Add an agent finding to the decision."""
+    def add_finding(self, finding: Union[AgentFinding, FindingRecord]) -> None:
+        """Add an agent finding (model or internal record) to the decision."""
+        if isinstance(finding, FindingRecord):
+            finding = finding.to_model()
         self.findings.append(finding)
     
+    def add_findings(self, payload: Union[str, bytes, List[Dict[str, Any]]]) -> List[AgentFinding]:
+        """
+        Validate and add a batch of findings from a tool payload.
+        
+        Args:
+            payload: Raw JSON array or list of finding dicts
+            
+        Returns:
+            The validated findings that were added
+        """
+        if isinstance(payload, (str, bytes)):
+            findings = FINDINGS_ADAPTER.validate_json(payload)
+        else:
+            findings = FINDINGS_ADAPTER.validate_python(payload)
+        self.findings.extend(findings)
+        return findings
+    
     def get_findings_by_status(self, status: FindingStatus) -> List[AgentFinding]:
         """Get all findings with a specific status."""
         return [f for f in self.findings if f.status == status]
@@ -147,3 +329,75 @@ class UnderwritingDecision(BaseModel):
     def all_checks_passed(self) -> bool:
         """Check if all findings passed."""
         return all(f.status == FindingStatus.PASS for f in self.findings)
+    
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the decision (including findings) to JSON bytes for API output.
+        
+        Uses orjson over the native-mode dump when available, so datetimes and
+        enums are encoded in C; falls back to pydantic's own serializer.
+        """
+        if HAS_ORJSON:
+            return orjson.dumps(self.model_dump(), option=orjson.OPT_SERIALIZE_NUMPY)
+        return self.model_dump_json().encode()
+
+
+# Small integer codes for columnar finding analytics
+_STATUS_CODES = {status: code for code, status in enumerate(FindingStatus)}
+_RISK_CODES = {risk: code for code, risk in enumerate(RiskLevel)}
+
+
+def summarize_findings(decisions: Iterable[UnderwritingDecision]) -> Dict[str, Any]:
+    """
+    Aggregate finding statistics across a batch of decisions.
+    
+    Findings are flattened once into columnar arrays (uint8 status/risk codes,
+    float32 confidence) so every statistic is a vectorized reduction rather
+    than another pass over the model objects.
+    
+    Args:
+        decisions: Decisions to aggregate
+        
+    Returns:
+        Dictionary with total_findings, pass_rate, mean_confidence,
+        critical_failures and risk_distribution
+    """
+    findings = [f for decision in decisions for f in decision.findings]
+    total = len(findings)
+    if total == 0:
+        return {
+            "total_findings": 0,
+            "pass_rate": 0.0,
+            "mean_confidence": 0.0,
+            "critical_failures": 0,
+            "risk_distribution": {risk.value: 0 for risk in RiskLevel}
+        }
+    
+    if HAS_NUMPY:
+        statuses = np.fromiter((_STATUS_CODES[f.status] for f in findings), dtype=np.uint8, count=total)
+        risks = np.fromiter((_RISK_CODES[f.risk_level] for f in findings), dtype=np.uint8, count=total)
+        confidence = np.fromiter((f.confidence for f in findings), dtype=np.float32, count=total)
+        
+        passed = int(np.count_nonzero(statuses == _STATUS_CODES[FindingStatus.PASS]))
+        critical = int(np.count_nonzero(
+            (statuses == _STATUS_CODES[FindingStatus.FAIL]) & (risks == _RISK_CODES[RiskLevel.CRITICAL])
+        ))
+        risk_counts = np.bincount(risks, minlength=len(_RISK_CODES)).tolist()
+        mean_confidence = float(confidence.mean())
+    else:
+        passed = sum(1 for f in findings if f.status == FindingStatus.PASS)
+        critical = sum(
+            1 for f in findings
+            if f.risk_level == RiskLevel.CRITICAL and f.status == FindingStatus.FAIL
+        )
+        counts = Counter(_RISK_CODES[f.risk_level] for f in findings)
+        risk_counts = [counts.get(code, 0) for code in range(len(_RISK_CODES))]
+        mean_confidence = sum(f.confidence for f in findings) / total
+    
+    return {
+        "total_findings": total,
+        "pass_rate": passed / total,
+        "mean_confidence": round(mean_confidence, 4),
+        "critical_failures": critical,
+        "risk_distribution": {risk.value: risk_counts[code] for risk, code in _RISK_CODES.items()}
+    }
@@ -0,0 +1,51 @@
+"""
+Shared pytest fixtures for the UW-Agent test suite.
+"""
+
+from pathlib import Path
+
+import pytest
+
+
+POLICY_FILE = Path(__file__).parent.parent / "policies" / "sample_policies.txt"
+
+
+def create_store(persist_directory=None, collection_name=None):
+    """Create and initialize a vector store (settings supply any omitted argument)."""
+    from tools.vector_store import PolicyVectorStore
+    
+    store = PolicyVectorStore(persist_directory=persist_directory, collection_name=collection_name)
+    store.initialize_db()
+    return store
+
+
+def _require_openai_key():
+    from config import get_settings
+    settings = get_settings()
+    
+    if not settings.openai_api_key or settings.openai_api_key == "your_openai_api_key_here":
+        pytest.skip("OpenAI API key not set (vector store tests require OpenAI embeddings)")
+
+
+@pytest.fixture(scope="session")
+def store():
+    """
+    Vector store initialized once per test session.
+    
+    Sample policies are embedded only if the persisted collection is empty,
+    so the OpenAI embedding cost is paid at most once per run.
+    """
+    _require_openai_key()
+    policy_store = create_store()
+    
+    if policy_store.collection.count() == 0:
+        policy_store.load_policies_from_file(str(POLICY_FILE))
+    
+    return policy_store
+
+
+@pytest.fixture
+def empty_store(tmp_path):
+    """Vector store on a throwaway collection, for tests that write to it."""
+    _require_openai_key()
+    return create_store(str(tmp_path / "chroma_db"), "test_policies")
@@ -4,96 +4,273 @@ Tests that all components are properly set up.
 """
 
 import sys
-import os
 from datetime import datetime
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pydantic import ValidationError
 
 def test_imports():
     """Test that all modules can be imported."""
-    try:
-        from models import CreditApplication, UnderwritingDecision, AgentFinding
-        from models import RiskLevel, DecisionStatus, FindingStatus
-        from config import settings
-        print("✓ All imports successful")
-        return True
-    except ImportError as e:
-        print(f"✗ Import error: {e}")
-        return False
+    from models import CreditApplication, UnderwritingDecision, AgentFinding
+    from models import RiskLevel, DecisionStatus, FindingStatus
+    from config import get_settings
+    print("✓ All imports successful")
+
+def _make_finding(**overrides):
+    """Build a passing AgentFinding, with any field overridden."""
+    from models import AgentFinding, RiskLevel, FindingStatus
+    
+    fields = dict(
+        agent_name="TestAgent",
+        check_type="TEST_CHECK",
+        status=FindingStatus.PASS,
+        risk_level=RiskLevel.LOW,
+        confidence=0.95,
+        reasoning="Test passed",
+        details={"test": True}
+    )
+    fields.update(overrides)
+    return AgentFinding(**fields)
+
+def _make_critical_failure():
+    """Build a critical FAIL finding."""
+    from models import RiskLevel, FindingStatus
+    
+    return _make_finding(
+        agent_name="FraudAgent",
+        check_type="FRAUD_CHECK",
+        status=FindingStatus.FAIL,
+        risk_level=RiskLevel.CRITICAL,
+        confidence=0.99,
+        reasoning="Synthetic identity detected",
+        details={}
+    )
+
+def _make_decision(application_id="APP-TEST-001"):
+    """Build an approved UnderwritingDecision with no findings."""
+    from models import UnderwritingDecision, DecisionStatus
+    
+    return UnderwritingDecision(
+        application_id=application_id,
+        decision=DecisionStatus.APPROVED,
+        confidence_score=0.92,
+        reasoning="All checks passed",
+        rules_applied=["IDENTITY_VERIFICATION"]
+    )
 
 def test_models():
     """Test Pydantic models."""
+    from models import CreditApplication
+    
+    # Test CreditApplication
+    app = CreditApplication(
+        application_id="APP-TEST-001",
+        customer_name="John Doe",
+        ssn="123-45-6789",
+        annual_income=75000.0,
+        credit_score=720,
+        review_rules=["IDENTITY_VERIFICATION", "FRAUD_CHECK"]
+    )
+    assert app.application_id == "APP-TEST-001"
+    
+    # Test AgentFinding
+    finding = _make_finding()
+    assert finding.confidence == 0.95
+    
+    # Test UnderwritingDecision
+    decision = _make_decision()
+    decision.add_finding(finding)
+    assert len(decision.findings) == 1
+    assert decision.all_checks_passed() == True
+    assert decision.has_critical_failures() == False
+    
+    print("✓ All models working correctly")
+
+def test_finding_frozen():
+    """Test that findings are immutable once created."""
+    from models import FindingStatus
+    
+    finding = _make_finding()
     try:
-        from models import (
-            CreditApplication, UnderwritingDecision, AgentFinding,
-            RiskLevel, DecisionStatus, FindingStatus
-        )
-        
-        # Test CreditApplication
-        app = CreditApplication(
-            application_id="APP-TEST-001",
-            customer_name="John Doe",
-            ssn="123-45-6789",
-            annual_income=75000.0,
-            credit_score=720,
-            review_rules=["IDENTITY_VERIFICATION", "FRAUD_CHECK"]
-        )
-        assert app.application_id == "APP-TEST-001"
-        
-        # Test AgentFinding
-        finding = AgentFinding(
-            agent_name="TestAgent",
-            check_type="TEST_CHECK",
+        finding.status = FindingStatus.FAIL
+        raise AssertionError("AgentFinding should be frozen")
+    except ValidationError:
+        pass
+    
+    print("✓ Findings are frozen")
+
+def test_finding_record():
+    """Test FindingRecord (internal slotted finding) conversion."""
+    from models import AgentFinding, FindingRecord, RiskLevel, FindingStatus
+    
+    record = FindingRecord(
+        agent_name="TestAgent",
+        check_type="TEST_CHECK",
+        status=FindingStatus.PASS,
+        risk_level=RiskLevel.LOW,
+        confidence=0.9,
+        reasoning="Record passed"
+    )
+    assert not hasattr(record, "__dict__")
+    
+    decision = _make_decision()
+    decision.add_finding(record)
+    assert isinstance(decision.findings[-1], AgentFinding)
+    assert decision.findings[-1].reasoning == "Record passed"
+    
+    print("✓ FindingRecord converted on add")
+
+def test_status_queries():
+    """Test status queries as findings are added or replaced."""
+    from models import FindingStatus
+    
+    decision = _make_decision()
+    decision.add_finding(_make_finding())
+    decision.add_finding(_make_finding(reasoning="Second check passed"))
+    decision.add_finding(_make_critical_failure())
+    assert len(decision.get_findings_by_status(FindingStatus.PASS)) == 2
+    assert len(decision.get_findings_by_status(FindingStatus.FAIL)) == 1
+    assert decision.has_critical_failures() == True
+    assert decision.all_checks_passed() == False
+    
+    # Status queries see findings replaced directly in the list
+    direct = _make_decision("APP-TEST-002")
+    direct.add_finding(_make_finding())
+    direct.findings[0] = _make_critical_failure()
+    assert direct.all_checks_passed() == False
+    assert direct.has_critical_failures() == True
+    assert len(direct.get_findings_by_status(FindingStatus.FAIL)) == 1
+    
+    print("✓ Status queries working correctly")
+
+def test_batch_timestamp():
+    """Test batch timestamp shared across models."""
+    from models import AgentFinding, RiskLevel, FindingStatus, batch_timestamp
+    
+    with batch_timestamp() as batch_now:
+        stamped = [
+            AgentFinding.trusted("TestAgent", "TEST_CHECK", FindingStatus.PASS,
+                                 RiskLevel.LOW, 0.9, "Batch finding")
+            for _ in range(3)
+        ]
+    assert all(f.timestamp == batch_now for f in stamped)
+    
+    print("✓ Batch timestamp shared across findings")
+
+def test_to_json_bytes():
+    """Test JSON bytes output round-trips."""
+    from models import UnderwritingDecision
+    
+    decision = _make_decision()
+    decision.add_finding(_make_critical_failure())
+    payload = decision.to_json_bytes()
+    assert isinstance(payload, bytes)
+    assert UnderwritingDecision.model_validate_json(payload).has_critical_failures() == True
+    
+    print("✓ JSON bytes output round-trips")
+
+def test_add_findings():
+    """Test batch finding ingestion from raw JSON."""
+    from models import FindingStatus
+    
+    decision = _make_decision()
+    decision.add_finding(_make_finding())
+    added = decision.add_findings(
+        b'[{"agent_name": "IncomeAgent", "check_type": "INCOME_VALIDATION", "status": "REVIEW",'
+        b' "risk_level": "MEDIUM", "confidence": 0.7, "reasoning": "Income unverified"}]'
+    )
+    assert len(added) == 1 and added[0].status == FindingStatus.REVIEW
+    assert len(decision.findings) == 2
+    assert len(decision.get_findings_by_status(FindingStatus.REVIEW)) == 1
+    
+    print("✓ Batch finding ingestion working correctly")
+
+def test_summarize_findings():
+    """Test batch finding analytics."""
+    from models import summarize_findings
+    
+    decision = _make_decision()
+    decision.add_finding(_make_finding())
+    decision.add_finding(_make_critical_failure())
+    summary = summarize_findings([decision])
+    assert summary["total_findings"] == len(decision.findings)
+    assert summary["critical_failures"] == 1
+    assert summary["risk_distribution"]["CRITICAL"] == 1
+    
+    print("✓ Finding analytics working correctly")
+
+def test_application_from_json():
+    """Test CreditApplication parsing from a raw JSON payload."""
+    from models import CreditApplication
+    
+    app = CreditApplication(
+        application_id="APP-TEST-002",
+        customer_name="Jane Smith",
+        ssn="987-65-4321",
+        annual_income=92000.0,
+        credit_score=745,
+        review_rules=["INCOME_VALIDATION"]
+    )
+    assert CreditApplication.from_json(app.model_dump_json()) == app
+    assert CreditApplication.from_json(app.model_dump_json().encode()) == app
+    
+    for invalid in ('{"application_id": "APP-TEST-003"}', "not json"):
+        try:
+            CreditApplication.from_json(invalid)
+            raise AssertionError(f"from_json({invalid!r}) should be rejected")
+        except ValidationError:
+            pass
+    
+    print("✓ CreditApplication JSON parsing working correctly")
+
+def test_finding_details_json():
+    """Test AgentFinding details given as raw JSON."""
+    from models import AgentFinding, RiskLevel, FindingStatus
+    
+    def make_finding(details):
+        return AgentFinding(
+            agent_name="IncomeAgent",
+            check_type="INCOME_VALIDATION",
             status=FindingStatus.PASS,
             risk_level=RiskLevel.LOW,
-            confidence=0.95,
-            reasoning="Test passed",
-            details={"test": True}
+            confidence=0.9,
+            reasoning="Income verified",
+            details=details
         )
-        assert finding.confidence == 0.95
-        
-        # Test UnderwritingDecision
-        decision = UnderwritingDecision(
-            application_id="APP-TEST-001",
-            decision=DecisionStatus.APPROVED,
-            confidence_score=0.92,
-            reasoning="All checks passed",
-            rules_applied=["IDENTITY_VERIFICATION"]
-        )
-        decision.add_finding(finding)
-        assert len(decision.findings) == 1
-        assert decision.all_checks_passed() == True
-        assert decision.has_critical_failures() == False
-        
-        print("✓ All models working correctly")
-        return True
-    except Exception as e:
-        print(f"✗ Model test error: {e}")
-        return False
+    
+    assert make_finding(b'{"income_verified": true}').details == {"income_verified": True}
+    assert make_finding('{"employer": "Tech Corp Inc"}').details == {"employer": "Tech Corp Inc"}
+    
+    for invalid in ("not json", b"[1, 2]", "42"):
+        try:
+            make_finding(invalid)
+            raise AssertionError(f"details={invalid!r} should be rejected")
+        except ValidationError as e:
+            assert "details" in str(e)
+    
+    print("✓ Finding details JSON decoding working correctly")
 
 def test_config():
     """Test configuration."""
-    try:
-        from config import settings
-        
-        assert settings.app_name == "UW-Agent"
-        assert settings.app_version == "0.1.0"
-        assert settings.openai_model == "gpt-4"
-        
-        openai_config = settings.get_openai_config()
-        assert "api_key" in openai_config
-        assert "model" in openai_config
-        
-        chroma_config = settings.get_chroma_config()
-        assert "persist_directory" in chroma_config
-        assert "collection_name" in chroma_config
-        
-        print("✓ Configuration working correctly")
-        return True
-    except Exception as e:
-        print(f"✗ Configuration test error: {e}")
-        return False
+    from config import get_settings
+    settings = get_settings()
+    
+    assert settings.app_name == "UW-Agent"
+    assert settings.app_version == "0.1.0"
+    assert settings.openai_model == "gpt-4o-mini"
+    
+    openai_config = settings.get_openai_config()
+    assert "api_key" in openai_config
+    assert "model" in openai_config
+    
+    chroma_config = settings.get_chroma_config()
+    assert "persist_directory" in chroma_config
+    assert "collection_name" in chroma_config
+    
+    # Callers get their own copy of the config
+    openai_config["model"] = "changed"
+    assert settings.get_openai_config()["model"] == "gpt-4o-mini"
+    
+    print("✓ Configuration working correctly")
 
 def test_project_structure():
     """Test that project structure exists."""
@@ -128,10 +305,8 @@ def test_project_structure():
             print(f"✗ Missing file: {file_name}")
             all_exist = False
     
-    if all_exist:
-        print("✓ Project structure complete")
-    
-    return all_exist
+    assert all_exist, "Project structure incomplete"
+    print("✓ Project structure complete")
 
 def main():
     """Run all verification tests."""
@@ -144,6 +319,15 @@ def main():
         ("Project Structure", test_project_structure),
         ("Module Imports", test_imports),
         ("Pydantic Models", test_models),
+        ("Frozen Findings", test_finding_frozen),
+        ("Finding Records", test_finding_record),
+        ("Status Queries", test_status_queries),
+        ("Batch Timestamp", test_batch_timestamp),
+        ("JSON Bytes Output", test_to_json_bytes),
+        ("Batch Finding Ingestion", test_add_findings),
+        ("Finding Analytics", test_summarize_findings),
+        ("Application From JSON", test_application_from_json),
+        ("Finding Details JSON", test_finding_details_json),
         ("Configuration", test_config),
     ]
     
@@ -151,7 +335,12 @@ def main():
     for test_name, test_func in tests:
         print(f"\nTesting: {test_name}")
         print("-" * 60)
-        results.append(test_func())
+        try:
+            test_func()
+            results.append(True)
+        except Exception as e:
+            print(f"✗ {test_name} failed: {e!r}")
+            results.append(False)
     
     print()
     print("=" * 60)
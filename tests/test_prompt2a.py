@@ -3,194 +3,342 @@ Test script for Policy Executor (Prompt 2a).
 """
 
 import sys
-import os
+import traceback
 from pathlib import Path
 import json
-
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from types import SimpleNamespace
 
 
 def test_policy_executor_import():
     """Test importing PolicyExecutor."""
-    try:
-        from tools.policy_executor import PolicyExecutor, StructuredRule, CheckConfig
-        print("✓ PolicyExecutor imports successful")
-        return True
-    except Exception as e:
-        print(f"✗ PolicyExecutor import failed: {e}")
-        return False
+    from tools.policy_executor import PolicyExecutor, StructuredRule, CheckConfig
+    print("✓ PolicyExecutor imports successful")
 
 
 def test_pydantic_models():
     """Test Pydantic models."""
-    try:
-        from tools.policy_executor import CheckConfig, DecisionCriteria, WorkflowConfig, StructuredRule
-        
-        # Test CheckConfig
-        check = CheckConfig(
-            name="test_check",
-            description="Test check",
-            tool="test_tool",
-            required=True
-        )
-        assert check.name == "test_check"
-        
-        # Test DecisionCriteria
-        criteria = DecisionCriteria(
-            approval_condition="all_pass",
-            min_confidence=0.9
-        )
-        assert criteria.min_confidence == 0.9
-        
-        # Test WorkflowConfig
-        workflow = WorkflowConfig(
-            parallel_execution=True,
-            timeout_seconds=45
-        )
-        assert workflow.timeout_seconds == 45
-        
-        # Test StructuredRule
-        rule = StructuredRule(
-            description="Test rule",
-            risk_level="HIGH",
-            required_agents=["identity"],
-            checks=[check],
-            decision_criteria=criteria,
-            workflow_config=workflow
-        )
-        assert rule.risk_level == "HIGH"
-        assert len(rule.checks) == 1
-        
-        print("✓ All Pydantic models working correctly")
-        return True
-    except Exception as e:
-        print(f"✗ Pydantic model test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    from tools.policy_executor import CheckConfig, DecisionCriteria, WorkflowConfig, StructuredRule
+    
+    # Test CheckConfig
+    check = CheckConfig(
+        name="test_check",
+        description="Test check",
+        tool="test_tool",
+        required=True
+    )
+    assert check.name == "test_check"
+    
+    # Test DecisionCriteria
+    criteria = DecisionCriteria(
+        approval_condition="all_pass",
+        min_confidence=0.9
+    )
+    assert criteria.min_confidence == 0.9
+    
+    # Test WorkflowConfig
+    workflow = WorkflowConfig(
+        parallel_execution=True,
+        timeout_seconds=45
+    )
+    assert workflow.timeout_seconds == 45
+    
+    # Test StructuredRule
+    rule = StructuredRule(
+        description="Test rule",
+        risk_level="HIGH",
+        required_agents=["identity"],
+        checks=[check],
+        decision_criteria=criteria,
+        workflow_config=workflow
+    )
+    assert rule.risk_level == "HIGH"
+    assert len(rule.checks) == 1
+    
+    print("✓ All Pydantic models working correctly")
 
 
 def test_generate_and_save_rules():
     """Test generating and saving structured rules."""
-    try:
-        from tools.vector_store import PolicyVectorStore
-        from tools.policy_executor import PolicyExecutor
-        from config import settings
-        
-        # Check API key
-        if not settings.openai_api_key or settings.openai_api_key == "your_openai_api_key_here":
-            print("⚠️  Skipping generation test - API key not configured")
-            return True
-        
-        # Initialize vector store
-        vector_store = PolicyVectorStore()
-        vector_store.initialize_db()
-        
-        # Load policies
-        policy_file = Path(__file__).parent.parent / "policies" / "sample_policies.txt"
-        vector_store.reset_collection()
-        vector_store.load_policies_from_file(str(policy_file))
-        
-        # Initialize executor
+    from tools.vector_store import PolicyVectorStore
+    from tools.policy_executor import PolicyExecutor
+    from config import get_settings
+    settings = get_settings()
+    
+    # Check API key
+    if not settings.openai_api_key or settings.openai_api_key == "your_openai_api_key_here":
+        print("⚠️  Skipping generation test - API key not configured")
+        return
+    
+    # Initialize vector store
+    vector_store = PolicyVectorStore()
+    vector_store.initialize_db()
+    
+    # Load policies
+    policy_file = Path(__file__).parent.parent / "policies" / "sample_policies.txt"
+    vector_store.reset_collection()
+    vector_store.load_policies_from_file(str(policy_file))
+    
+    # Initialize executor
+    executor = PolicyExecutor()
+    executor.initialize(vector_store)
+    
+    # Generate rules
+    print("  Generating structured rules...")
+    rules = executor.generate_structured_rules()
+    
+    assert len(rules) > 0, "No rules generated"
+    print(f"✓ Generated {len(rules)} structured rules")
+    
+    # Save rules
+    test_rules_path = "policies/test_structured_rules.json"
+    executor.save_rules(test_rules_path)
+    
+    assert Path(test_rules_path).exists(), "Rules file not created"
+    print(f"✓ Saved rules to {test_rules_path}")
+    
+    # Clean up
+    Path(test_rules_path).unlink()
+    Path(test_rules_path).with_suffix(".hashes.json").unlink(missing_ok=True)
+
+
+class _FakePolicyStore:
+    """Vector store stand-in serving fixed policy texts."""
+    
+    def __init__(self, policies):
+        self.policies = policies
+    
+    def dump_policies_by_rule(self):
+        return dict(self.policies)
+
+
+class _CountingRuleLLM:
+    """Structured-output LLM stand-in that counts extraction calls."""
+    
+    def __init__(self, rule):
+        self.rule = rule
+        self.calls = 0
+    
+    def invoke(self, messages):
+        self.calls += 1
+        return self.rule
+
+
+def test_generate_skips_unchanged_policies():
+    """Test that unchanged policies reuse their saved rule without an LLM call."""
+    from tools.policy_executor import PolicyExecutor, StructuredRule
+    
+    rule = StructuredRule.model_validate(
+        json.loads(Path("policies/structured_rules.json").read_text())["INCOME_VALIDATION"]
+    )
+    store = _FakePolicyStore({"TEST_RULE": "REVIEW_RULE: TEST_RULE\nVerify income."})
+    
+    def make_executor():
         executor = PolicyExecutor()
-        executor.initialize(vector_store)
-        
-        # Generate rules
-        print("  Generating structured rules...")
-        rules = executor.generate_structured_rules()
-        
-        assert len(rules) > 0, "No rules generated"
-        print(f"✓ Generated {len(rules)} structured rules")
-        
-        # Save rules
-        test_rules_path = "policies/test_structured_rules.json"
+        executor.vector_store = store
+        executor.llm = executor.rule_llm = _CountingRuleLLM(rule)
+        return executor
+    
+    test_rules_path = "policies/test_hash_rules.json"
+    try:
+        executor = make_executor()
+        executor.generate_structured_rules()
+        assert executor.rule_llm.calls == 1
         executor.save_rules(test_rules_path)
         
-        assert Path(test_rules_path).exists(), "Rules file not created"
-        print(f"✓ Saved rules to {test_rules_path}")
-        
-        # Clean up
-        Path(test_rules_path).unlink()
+        # A new executor with the saved rules skips the unchanged policy
+        executor = make_executor()
+        executor.load_rules(test_rules_path)
+        assert "TEST_RULE" in executor.generate_structured_rules()
+        assert executor.rule_llm.calls == 0, "Unchanged policy was sent to the LLM"
         
-        return True
-    except Exception as e:
-        print(f"✗ Generate and save test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+        # force=True and changed policy text both regenerate
+        executor.generate_structured_rules(force=True)
+        assert executor.rule_llm.calls == 1
+        store.policies["TEST_RULE"] += " Updated."
+        executor.generate_structured_rules()
+        assert executor.rule_llm.calls == 2
+    finally:
+        Path(test_rules_path).unlink(missing_ok=True)
+        Path(test_rules_path).with_suffix(".hashes.json").unlink(missing_ok=True)
+    
+    print("✓ Unchanged policies skip rule extraction")
+
+
+class _FakeBatchClient:
+    """OpenAI client stand-in for the files and batches endpoints."""
+    
+    def __init__(self):
+        self.requests = []
+        self.output = ""
+        self.batch = SimpleNamespace(id="batch_1", status="in_progress", output_file_id=None)
+        self.files = SimpleNamespace(create=self._create_file, content=lambda file_id: SimpleNamespace(text=self.output))
+        self.batches = SimpleNamespace(
+            create=lambda **kwargs: self.batch,
+            retrieve=lambda batch_id: self.batch,
+            cancel=lambda batch_id: None
+        )
+    
+    def _create_file(self, file, purpose):
+        self.requests = [json.loads(line) for line in file[1].decode().splitlines()]
+        return SimpleNamespace(id="file_1")
+
+
+def test_rules_batch():
+    """Test submitting and collecting rule extraction through the Batch API."""
+    from tools.policy_executor import PolicyExecutor, StructuredRule
+    
+    rule = StructuredRule.model_validate(
+        json.loads(Path("policies/structured_rules.json").read_text())["INCOME_VALIDATION"]
+    )
+    executor = PolicyExecutor()
+    executor.vector_store = _FakePolicyStore({
+        "TEST_RULE": "REVIEW_RULE: TEST_RULE\nVerify income.",
+        "OTHER_RULE": "REVIEW_RULE: OTHER_RULE\nVerify identity.",
+    })
+    executor.llm = executor.rule_llm = _CountingRuleLLM(rule)
+    executor.batch_client = client = _FakeBatchClient()
+    
+    batch_id = executor.submit_rules_batch()
+    assert batch_id == "batch_1"
+    assert sorted(request["custom_id"] for request in client.requests) == ["OTHER_RULE", "TEST_RULE"]
+    assert executor.collect_rules_batch(batch_id) is None, "Running batch should not be collected"
+    
+    # OTHER_RULE is missing from the output, so it falls back to a real-time call
+    client.batch.status, client.batch.output_file_id = "completed", "file_2"
+    client.output = json.dumps({
+        "custom_id": "TEST_RULE",
+        "response": {"status_code": 200, "body": {"choices": [{"message": {"content": rule.model_dump_json()}}]}},
+    })
+    rules = executor.collect_rules_batch(batch_id)
+    assert set(rules) == {"TEST_RULE", "OTHER_RULE"}
+    assert executor.rule_llm.calls == 1
+    
+    # Unchanged policies are not resubmitted
+    assert executor.submit_rules_batch() is None
+    
+    print("✓ Batch rule extraction working correctly")
 
 
 def test_load_rules():
     """Test loading rules from JSON."""
-    try:
-        from tools.policy_executor import PolicyExecutor
-        
-        # Create sample rules file
-        sample_rules = {
-            "TEST_RULE": {
-                "description": "Test rule",
-                "risk_level": "MEDIUM",
-                "required_agents": ["test"],
-                "checks": [
-                    {
-                        "name": "test_check",
-                        "description": "Test",
-                        "tool": "test_tool",
-                        "required": True,
-                        "threshold": None,
-                        "zero_tolerance": False
-                    }
-                ],
-                "decision_criteria": {
-                    "approval_condition": "all_pass",
-                    "min_confidence": 0.8,
-                    "dti_threshold": None,
-                    "zero_tolerance_checks": [],
-                    "requires_manual_signoff": False
-                },
-                "workflow_config": {
-                    "parallel_execution": False,
-                    "timeout_seconds": 30,
-                    "retry_on_failure": False,
-                    "cascade_mode": False
+    from tools.policy_executor import PolicyExecutor
+    
+    # Create sample rules file
+    sample_rules = {
+        "TEST_RULE": {
+            "description": "Test rule",
+            "risk_level": "MEDIUM",
+            "required_agents": ["test"],
+            "checks": [
+                {
+                    "name": "test_check",
+                    "description": "Test",
+                    "tool": "test_tool",
+                    "required": True,
+                    "threshold": None,
+                    "zero_tolerance": False
                 }
+            ],
+            "decision_criteria": {
+                "approval_condition": "all_pass",
+                "min_confidence": 0.8,
+                "dti_threshold": None,
+                "zero_tolerance_checks": [],
+                "requires_manual_signoff": False
+            },
+            "workflow_config": {
+                "parallel_execution": False,
+                "timeout_seconds": 30,
+                "retry_on_failure": False,
+                "cascade_mode": False
             }
         }
-        
-        # Save to temp file
-        test_file = "policies/test_load_rules.json"
-        Path(test_file).parent.mkdir(exist_ok=True)
-        with open(test_file, 'w') as f:
-            json.dump(sample_rules, f)
-        
-        # Load rules
-        executor = PolicyExecutor()
-        loaded = executor.load_rules(test_file)
-        
-        assert len(loaded) == 1, "Failed to load rules"
-        assert "TEST_RULE" in loaded, "Rule not found"
-        
-        print("✓ Successfully loaded rules from JSON")
-        
-        # Test getters
-        workflow = executor.get_workflow_config("TEST_RULE")
-        assert workflow is not None, "Failed to get workflow config"
-        
-        criteria = executor.get_decision_criteria("TEST_RULE")
-        assert criteria is not None, "Failed to get decision criteria"
-        
-        print("✓ Rule getters working correctly")
-        
-        # Clean up
-        Path(test_file).unlink()
-        
-        return True
-    except Exception as e:
-        print(f"✗ Load rules test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    }
+    
+    # Save to temp file
+    test_file = "policies/test_load_rules.json"
+    Path(test_file).parent.mkdir(exist_ok=True)
+    with open(test_file, 'w') as f:
+        json.dump(sample_rules, f)
+    
+    # Load rules
+    executor = PolicyExecutor()
+    loaded = executor.load_rules(test_file)
+    
+    assert len(loaded) == 1, "Failed to load rules"
+    assert "TEST_RULE" in loaded, "Rule not found"
+    
+    print("✓ Successfully loaded rules from JSON")
+    
+    # Test getters
+    workflow = executor.get_workflow_config("TEST_RULE")
+    assert workflow is not None, "Failed to get workflow config"
+    
+    criteria = executor.get_decision_criteria("TEST_RULE")
+    assert criteria is not None, "Failed to get decision criteria"
+    
+    print("✓ Rule getters working correctly")
+    
+    # Reloading an unchanged file gives each executor its own rules
+    reloaded = PolicyExecutor().load_rules(test_file)
+    assert reloaded["TEST_RULE"] == loaded["TEST_RULE"]
+    assert reloaded["TEST_RULE"] is not loaded["TEST_RULE"], "Rule models shared between executors"
+    
+    # Clean up
+    Path(test_file).unlink()
+
+
+def test_rule_evaluator():
+    """Test compiled rule evaluators."""
+    from tools.policy_executor import PolicyExecutor
+    
+    executor = PolicyExecutor()
+    executor.load_rules("policies/structured_rules.json")
+    
+    evaluate = executor.get_rule_evaluator("INCOME_VALIDATION")
+    checks = {check.name: True for check in executor.get_rule("INCOME_VALIDATION").checks}
+    
+    assert evaluate({**checks, "dti": 0.30, "confidence": 0.9})["passed"]
+    outcome = evaluate({**checks, "dti": 0.50})
+    assert not outcome["passed"] and outcome["failed_checks"] == ["dti_threshold"]
+    assert not evaluate({**checks, "confidence": 0.5})["passed"]
+    
+    # Zero tolerance failures are flagged
+    fraud = executor.get_rule_evaluator("FRAUD_CHECK")({"ofac_screening": False})
+    assert fraud["zero_tolerance_failure"] and "ofac_screening" in fraud["failed_checks"]
+    
+    # Zero tolerance checks are evaluated even when they are not required
+    from tools.policy_executor import CheckConfig, DecisionCriteria, StructuredRule, WorkflowConfig, _compile_rule
+    rule = StructuredRule(
+        description="Watchlist screening",
+        risk_level="HIGH",
+        required_agents=["fraud"],
+        checks=[
+            CheckConfig(name="identity_match", description="Identity match", tool="identity_api"),
+            CheckConfig(name="watchlist_hit", description="Watchlist screen", tool="fraud_api",
+                        required=False, zero_tolerance=True, threshold=0.9),
+        ],
+        decision_criteria=DecisionCriteria(approval_condition="no_watchlist_hits"),
+        workflow_config=WorkflowConfig()
+    )
+    evaluate_watchlist = _compile_rule(rule)
+    outcome = evaluate_watchlist({"identity_match": True, "watchlist_hit": False})
+    assert not outcome["passed"] and outcome["zero_tolerance_failure"]
+    assert outcome["failed_checks"] == ["watchlist_hit"]
+    assert outcome["approval_condition"] == "no_watchlist_hits"
+    assert outcome["thresholds"] == {"watchlist_hit": 0.9}
+    assert evaluate_watchlist({"identity_match": True})["passed"]
+    
+    # Manual sign-off rules never pass automatically
+    high_risk = executor.get_rule_evaluator("HIGH_RISK_PROFILE")({})
+    assert high_risk["checks_passed"] and not high_risk["passed"]
+    assert high_risk["requires_manual_signoff"]
+    
+    # Evaluators are reused until the rule changes
+    assert executor.get_rule_evaluator("INCOME_VALIDATION") is evaluate
+    assert executor.get_rule_evaluator("UNKNOWN_RULE") is None
+    
+    print("✓ Rule evaluators working correctly")
 
 
 def main():
@@ -204,6 +352,9 @@ def main():
         ("Policy Executor Import", test_policy_executor_import),
         ("Pydantic Models", test_pydantic_models),
         ("Load Rules from JSON", test_load_rules),
+        ("Rule Evaluators", test_rule_evaluator),
+        ("Skip Unchanged Policies", test_generate_skips_unchanged_policies),
+        ("Batch Rule Extraction", test_rules_batch),
         ("Generate and Save Rules", test_generate_and_save_rules),
     ]
     
@@ -211,7 +362,13 @@ def main():
     for test_name, test_func in tests:
         print(f"Testing: {test_name}")
         print("-" * 60)
-        success = test_func()
+        try:
+            test_func()
+            success = True
+        except Exception as e:
+            print(f"✗ {test_name} failed: {e!r}")
+            traceback.print_exc()
+            success = False
         results.append((test_name, success))
         print()
     
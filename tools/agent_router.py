@@ -5,8 +5,9 @@ This module determines which agents should be invoked based on the review rule t
 Special handling for FRAUD_CHECK which requires Identity and Income verification first.
 """
 
-from typing import List, Dict, Set
+from typing import List, Dict, FrozenSet, NamedTuple, Optional, Tuple
 from enum import Enum
+from functools import cache, lru_cache
 
 
 class AgentType(Enum):
@@ -16,6 +17,20 @@ class AgentType(Enum):
     FRAUD = "fraud"
 
 
+# Bit flag per agent (in canonical identity -> income -> fraud order) for cheap set arithmetic
+AGENT_BITS: Dict[AgentType, int] = {agent: 1 << i for i, agent in enumerate(AgentType)}
+
+# Agent name strings, so per-plan code skips the Enum .value descriptor
+_AGENT_VALUES: Dict[AgentType, str] = {agent: agent.value for agent in AgentType}
+
+
+class RuleInfo(NamedTuple):
+    """Routing details for a single review rule."""
+    agents: Tuple[str, ...]
+    risk_level: str
+    has_prerequisites: bool
+
+
 class ReviewRuleRouter:
     """
     Routes review rules to appropriate agents based on policy configuration.
@@ -27,17 +42,18 @@ class ReviewRuleRouter:
     - HIGH_RISK_PROFILE → All Agents (Identity + Income + Fraud)
     """
     
-    # Core routing map from review rules to primary agents
+    # Core routing map from review rules to primary agents.
+    # Tuples, since the precomputed plans below the class are derived from these at import.
     ROUTING_MAP = {
-        "IDENTITY_VERIFICATION": [AgentType.IDENTITY],
-        "INCOME_VALIDATION": [AgentType.INCOME],
-        "FRAUD_CHECK": [AgentType.FRAUD],
-        "HIGH_RISK_PROFILE": [AgentType.IDENTITY, AgentType.INCOME, AgentType.FRAUD],
+        "IDENTITY_VERIFICATION": (AgentType.IDENTITY,),
+        "INCOME_VALIDATION": (AgentType.INCOME,),
+        "FRAUD_CHECK": (AgentType.FRAUD,),
+        "HIGH_RISK_PROFILE": (AgentType.IDENTITY, AgentType.INCOME, AgentType.FRAUD),
     }
     
     # Special prerequisites - agents that must run BEFORE the primary agent
     PREREQUISITES = {
-        "FRAUD_CHECK": [AgentType.IDENTITY, AgentType.INCOME],
+        "FRAUD_CHECK": (AgentType.IDENTITY, AgentType.INCOME),
         # HIGH_RISK_PROFILE already includes all agents, no extra prerequisites
     }
     
@@ -49,6 +65,11 @@ class ReviewRuleRouter:
         "HIGH_RISK_PROFILE": "HIGH",
     }
     
+    # Precomputed agent orders per rule, keyed by include_prerequisites (filled in below the class)
+    _AGENT_PLANS: Dict[str, Dict[bool, Tuple[AgentType, ...]]] = {}
+    _AGENT_NAME_PLANS: Dict[str, Dict[bool, Tuple[str, ...]]] = {}
+    _AGENT_MASKS: Dict[str, int] = {}
+    
     @classmethod
     def get_required_agents(cls, review_rule: str, include_prerequisites: bool = True) -> List[AgentType]:
         """
@@ -68,9 +89,15 @@ class ReviewRuleRouter:
             >>> ReviewRuleRouter.get_required_agents("FRAUD_CHECK", include_prerequisites=False)
             [AgentType.FRAUD]
         """
-        if review_rule not in cls.ROUTING_MAP:
+        plans = cls._AGENT_PLANS.get(review_rule)
+        if plans is None:
             raise ValueError(f"Unknown review rule: {review_rule}. Valid rules: {list(cls.ROUTING_MAP.keys())}")
         
+        return list(plans[bool(include_prerequisites)])
+    
+    @classmethod
+    def _compute_required_agents(cls, review_rule: str, include_prerequisites: bool) -> Tuple[AgentType, ...]:
+        """Resolve the ordered, de-duplicated agents for a rule from the routing tables."""
         agents = []
         
         # Add prerequisites first (if enabled)
@@ -84,7 +111,7 @@ class ReviewRuleRouter:
             if agent not in agents:
                 agents.append(agent)
         
-        return agents
+        return tuple(agents)
     
     @classmethod
     def get_agent_names(cls, review_rule: str, include_prerequisites: bool = True) -> List[str]:
@@ -102,8 +129,11 @@ class ReviewRuleRouter:
             >>> ReviewRuleRouter.get_agent_names("FRAUD_CHECK")
             ["identity", "income", "fraud"]
         """
-        agents = cls.get_required_agents(review_rule, include_prerequisites)
-        return [agent.value for agent in agents]
+        names = cls._AGENT_NAME_PLANS.get(review_rule)
+        if names is None:
+            raise ValueError(f"Unknown review rule: {review_rule}. Valid rules: {list(cls.ROUTING_MAP.keys())}")
+        
+        return list(names[bool(include_prerequisites)])
     
     @classmethod
     def requires_prerequisites(cls, review_rule: str) -> bool:
@@ -144,6 +174,26 @@ class ReviewRuleRouter:
         """
         return cls.get_risk_level(review_rule) == "CRITICAL"
     
+    @classmethod
+    @cache
+    def rule_info(cls, review_rule: str) -> RuleInfo:
+        """
+        Get agents (with prerequisites), risk level and prerequisite flag for a rule.
+        
+        Computed once per rule and cached, since the routing tables are static.
+        
+        Args:
+            review_rule: The review rule name
+            
+        Returns:
+            RuleInfo tuple
+        """
+        return RuleInfo(
+            agents=tuple(cls.get_agent_names(review_rule)),
+            risk_level=cls.get_risk_level(review_rule),
+            has_prerequisites=cls.requires_prerequisites(review_rule),
+        )
+    
     @classmethod
     def get_all_review_rules(cls) -> List[str]:
         """
@@ -159,15 +209,26 @@ class ReviewRuleRouter:
         """
         Get a complete summary of all routing configurations.
         
+        The summary is computed once; each call returns a fresh copy.
+        
         Returns:
             Dict with routing details for each review rule
         """
+        return {
+            rule: {key: list(value) if isinstance(value, tuple) else value for key, value in details.items()}
+            for rule, details in cls._routing_summary().items()
+        }
+    
+    @classmethod
+    @cache
+    def _routing_summary(cls) -> Dict[str, Dict]:
+        """Routing summary with agent lists as tuples, built once since the routing tables are static."""
         summary = {}
         for rule in cls.get_all_review_rules():
             summary[rule] = {
-                "primary_agents": [a.value for a in cls.ROUTING_MAP[rule]],
-                "prerequisites": [a.value for a in cls.PREREQUISITES.get(rule, [])],
-                "execution_order": cls.get_agent_names(rule, include_prerequisites=True),
+                "primary_agents": tuple(a.value for a in cls.ROUTING_MAP[rule]),
+                "prerequisites": tuple(a.value for a in cls.PREREQUISITES.get(rule, ())),
+                "execution_order": tuple(cls.get_agent_names(rule, include_prerequisites=True)),
                 "risk_level": cls.get_risk_level(rule),
                 "is_critical": cls.is_critical_rule(rule),
             }
@@ -187,37 +248,87 @@ class ReviewRuleRouter:
         validation_results = {}
         
         for rule_name, rule_config in structured_rules.items():
-            warnings = []
-            
-            # Check if rule is recognized
-            if rule_name not in cls.ROUTING_MAP:
-                warnings.append(f"Unknown review rule: {rule_name}")
-                validation_results[rule_name] = warnings
-                continue
-            
-            # Check required_agents field
-            if "required_agents" not in rule_config:
-                warnings.append("Missing 'required_agents' field")
-            else:
-                configured_agents = set(rule_config["required_agents"])
-                expected_agents = set(cls.get_agent_names(rule_name, include_prerequisites=False))
-                
-                if configured_agents != expected_agents:
-                    warnings.append(
-                        f"Agent mismatch - Expected: {expected_agents}, Got: {configured_agents}"
-                    )
+            configured_agents = rule_config.get("required_agents")
+            validation_results[rule_name] = list(cls._rule_warnings(
+                rule_name,
+                frozenset(configured_agents) if configured_agents is not None else None,
+                "risk_level" in rule_config,
+                rule_config.get("risk_level"),
+            ))
+        
+        return validation_results
+    
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _rule_warnings(
+        cls,
+        rule_name: str,
+        configured_agents: Optional[FrozenSet[str]],
+        has_risk_level: bool,
+        risk_level: Optional[str]
+    ) -> Tuple[str, ...]:
+        """
+        Validate a single structured rule against the routing configuration.
+        
+        Memoized on the rule's relevant fields, so re-validating an unchanged
+        rules file is a lookup per rule.
+        
+        Args:
+            rule_name: Review rule name
+            configured_agents: Agents from the rule's required_agents (None if missing)
+            has_risk_level: Whether the rule has a risk_level field
+            risk_level: Rule's risk_level
             
-            # Check risk level
-            if "risk_level" in rule_config:
-                if rule_config["risk_level"] != cls.get_risk_level(rule_name):
-                    warnings.append(
-                        f"Risk level mismatch - Expected: {cls.get_risk_level(rule_name)}, "
-                        f"Got: {rule_config['risk_level']}"
-                    )
+        Returns:
+            Tuple of warning messages
+        """
+        # Check if rule is recognized
+        if rule_name not in cls.ROUTING_MAP:
+            return (f"Unknown review rule: {rule_name}",)
+        
+        warnings = []
+        
+        # Check required_agents field
+        if configured_agents is None:
+            warnings.append("Missing 'required_agents' field")
+        else:
+            expected_agents = set(cls.get_agent_names(rule_name, include_prerequisites=False))
             
-            validation_results[rule_name] = warnings
+            if configured_agents != expected_agents:
+                warnings.append(
+                    f"Agent mismatch - Expected: {expected_agents}, Got: {set(configured_agents)}"
+                )
         
-        return validation_results
+        # Check risk level
+        if has_risk_level:
+            if risk_level != cls.get_risk_level(rule_name):
+                warnings.append(
+                    f"Risk level mismatch - Expected: {cls.get_risk_level(rule_name)}, "
+                    f"Got: {risk_level}"
+                )
+        
+        return tuple(warnings)
+
+
+# Routing tables are static, so resolve every (rule, include_prerequisites) pair once at import
+ReviewRuleRouter._AGENT_PLANS = {
+    rule: {flag: ReviewRuleRouter._compute_required_agents(rule, flag) for flag in (True, False)}
+    for rule in ReviewRuleRouter.ROUTING_MAP
+}
+ReviewRuleRouter._AGENT_NAME_PLANS = {
+    rule: {flag: tuple(agent.value for agent in agents) for flag, agents in plans.items()}
+    for rule, plans in ReviewRuleRouter._AGENT_PLANS.items()
+}
+ReviewRuleRouter._AGENT_MASKS = {
+    rule: sum(AGENT_BITS[agent] for agent in plans[True])
+    for rule, plans in ReviewRuleRouter._AGENT_PLANS.items()
+}
+
+# Execution priority per rule (CRITICAL > HIGH > MEDIUM), used as the plan sort key
+_RULE_PRIORITY: Dict[str, int] = {
+    rule: {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2}.get(ReviewRuleRouter.get_risk_level(rule), 3)
+    for rule in ReviewRuleRouter.ROUTING_MAP
+}
 
 
 def get_agent_execution_plan(review_rules: List[str]) -> Dict:
@@ -241,40 +352,42 @@ def get_agent_execution_plan(review_rules: List[str]) -> Dict:
         ["identity", "income", "fraud"]
     """
     # Sort rules by priority (CRITICAL > HIGH > MEDIUM)
-    priority_order = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2}
-    sorted_rules = sorted(
-        review_rules,
-        key=lambda r: priority_order.get(ReviewRuleRouter.get_risk_level(r), 3)
-    )
-    
-    # Collect all required agents maintaining order
-    all_agents: List[AgentType] = []
-    seen_agents: Set[AgentType] = set()
+    try:
+        sorted_rules = sorted(review_rules, key=_RULE_PRIORITY.__getitem__)
+    except KeyError as e:
+        raise ValueError(
+            f"Unknown review rule: {e.args[0]}. Valid rules: {list(ReviewRuleRouter.ROUTING_MAP.keys())}"
+        ) from None
     
+    # OR together each rule's precomputed agent mask, then emit agents in canonical
+    # order; every routing entry lists prerequisites in that order, so it satisfies them
+    agent_mask = 0
+    has_critical_rules = False
     rule_details = []
     
     for rule in sorted_rules:
-        required_agents = ReviewRuleRouter.get_required_agents(rule, include_prerequisites=True)
+        agent_names = ReviewRuleRouter.get_agent_names(rule, include_prerequisites=True)
+        risk_level = ReviewRuleRouter.get_risk_level(rule)
+        is_critical = risk_level == "CRITICAL"
         
-        # Add agents in order, avoiding duplicates
-        for agent in required_agents:
-            if agent not in seen_agents:
-                all_agents.append(agent)
-                seen_agents.add(agent)
+        agent_mask |= ReviewRuleRouter._AGENT_MASKS[rule]
+        has_critical_rules = has_critical_rules or is_critical
         
         rule_details.append({
             "rule": rule,
-            "risk_level": ReviewRuleRouter.get_risk_level(rule),
-            "agents": [a.value for a in required_agents],
-            "is_critical": ReviewRuleRouter.is_critical_rule(rule),
+            "risk_level": risk_level,
+            "agents": agent_names,
+            "is_critical": is_critical,
         })
     
+    execution_order = [_AGENT_VALUES[agent] for agent, bit in AGENT_BITS.items() if agent_mask & bit]
+    
     return {
-        "execution_order": [a.value for a in all_agents],
-        "total_agents": len(all_agents),
+        "execution_order": execution_order,
+        "total_agents": len(execution_order),
         "rules_by_priority": sorted_rules,
         "rule_details": rule_details,
-        "has_critical_rules": any(ReviewRuleRouter.is_critical_rule(r) for r in review_rules),
+        "has_critical_rules": has_critical_rules,
     }
 
 
@@ -295,11 +408,10 @@ if __name__ == "__main__":
     print("-" * 70)
     
     for rule in ReviewRuleRouter.get_all_review_rules():
-        agents = ReviewRuleRouter.get_agent_names(rule)
-        risk = ReviewRuleRouter.get_risk_level(rule)
+        agents, risk, has_prereqs = ReviewRuleRouter.rule_info(rule)
         print(f"\n{rule} ({risk}):")
         print(f"  Agents: {' → '.join(agents)}")
-        if ReviewRuleRouter.requires_prerequisites(rule):
+        if has_prereqs:
             prereqs = [a.value for a in ReviewRuleRouter.PREREQUISITES[rule]]
             print(f"  Prerequisites: {', '.join(prereqs)}")
     
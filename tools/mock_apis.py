@@ -4,10 +4,25 @@ These simulate real-world external API calls with realistic responses and random
 """
 
 import random
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+from datetime import date, datetime, timedelta
 import json
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 
 # Mock database of known entities for realistic responses
 MOCK_IDENTITY_DATABASE = {
@@ -68,15 +83,199 @@ MOCK_INCOME_DATABASE = {
     },
 }
 
-MOCK_OFAC_LIST = [
+# Sets, since these are only used for membership checks
+MOCK_OFAC_LIST = frozenset([
     "444-55-6666",
     "555-66-7777",
-]
+])
 
 MOCK_FRAUD_PATTERNS = {
-    "high_risk_ips": ["192.168.1.100", "10.0.0.50"],
-    "high_velocity_ssns": ["333-44-5555", "666-77-8888"],
+    "high_risk_ips": frozenset(["192.168.1.100", "10.0.0.50"]),
+    "high_velocity_ssns": frozenset(["333-44-5555", "666-77-8888"]),
+}
+
+# Identity records merged once so lookups don't rebuild the dict per call
+_ALL_IDENTITY_RECORDS = {**MOCK_IDENTITY_DATABASE["valid"], **MOCK_IDENTITY_DATABASE["suspicious"]}
+_VALID_SSN_SET = frozenset(MOCK_IDENTITY_DATABASE["valid"])
+# Lowercased (name, address) per SSN, so identity matching only lowercases the input
+_IDENTITY_MATCH_KEYS = {
+    ssn: (record["name"].lower(), record["address"].lower())
+    for ssn, record in _ALL_IDENTITY_RECORDS.items()
+}
+
+# Each known SSN's check_identity response with its static fields resolved;
+# the None fields depend on the call and are filled in per response
+_IDENTITY_RESPONSE_TEMPLATES = {
+    ssn: {
+        "success": True,
+        "ssn": ssn,
+        "ssn_valid": record["identity_verified"],
+        "name_match": None,
+        "address_match": None,
+        "identity_theft_flags": record["identity_theft_flags"],
+        "address_history_months": record["address_history_months"],
+        "government_verified": record["government_verified"],
+        "confidence_score": None,
+        "checks_passed": {
+            "ssn_validation": record["identity_verified"],
+            "identity_theft_check": not record["identity_theft_flags"],
+            "address_verification": record["address_history_months"] >= 6,
+            "government_database_check": record["government_verified"]
+        },
+        "timestamp": None,
+        "response_time_ms": None
+    }
+    for ssn, record in _ALL_IDENTITY_RECORDS.items()
+}
+
+# Static response fields, shared by every response instead of rebuilt per call
+_OFAC_LISTS_CHECKED = ("SDN", "Non-SDN", "Sectoral Sanctions")
+_CREDIT_SCORE_FACTORS = (
+    "Payment History (35%)",
+    "Credit Utilization (30%)",
+    "Length of Credit History (15%)",
+    "Credit Mix (10%)",
+    "New Credit (10%)"
+)
+
+# Static fields of the "SSN not found" responses; checks_passed is copied per call
+_IDENTITY_NOT_FOUND = {
+    "success": False,
+    "ssn_valid": False,
+    "name_match": False,
+    "address_match": False,
+    "identity_theft_flags": False,
+    "address_history_months": 0,
+    "government_verified": False,
+    "confidence_score": 0.0,
+    "checks_passed": {
+        "ssn_validation": False,
+        "identity_theft_check": True,
+        "address_verification": False,
+        "government_database_check": False
+    },
+    "error": "SSN not found in credit bureau records",
 }
+_INCOME_NOT_FOUND = {
+    "success": False,
+    "verified_income": None,
+    "income_match": False,
+    "employment_stable": False,
+    "documentation_complete": False,
+    "dti_ratio": None,
+    "confidence_score": 0.0,
+    "checks_passed": {
+        "employment_verification": False,
+        "income_documentation": False,
+        "income_stability": False,
+        "dti_calculation": False
+    },
+    "error": "Unable to verify income - SSN not found",
+}
+
+# Employment statuses that pass income employment verification
+_ACCEPTED_EMPLOYMENT_STATUSES = frozenset({"full_time", "part_time"})
+
+# Fields of a check_ofac response that depend only on whether the SSN is listed
+_OFAC_HIT_RESULT = {
+    "success": True,
+    "on_ofac_list": True,
+    "match_type": "exact",
+    "sanctions_found": True,
+    "screening_passed": False,
+    "lists_checked": _OFAC_LISTS_CHECKED,
+    "confidence_score": 0.0,
+}
+_OFAC_MISS_RESULT = {
+    "success": True,
+    "on_ofac_list": False,
+    "match_type": "none",
+    "sanctions_found": False,
+    "screening_passed": True,
+    "lists_checked": _OFAC_LISTS_CHECKED,
+    "confidence_score": 1.0,
+}
+
+
+# Random source for every mock; seed it with set_seed() for reproducible runs
+_rng = random.Random()
+
+
+def set_seed(seed: int) -> None:
+    """
+    Seed the mock APIs' random source so their responses are reproducible.
+    
+    Args:
+        seed: Seed value
+    """
+    _rng.seed(seed)
+
+
+# When False, mocks skip drawing a simulated latency and report response_time_ms=0
+SIMULATE_LATENCY = True
+
+
+@contextmanager
+def disable_latency_sim() -> Iterator[None]:
+    """
+    Temporarily turn off latency simulation, e.g. for bulk scoring runs.
+    """
+    global SIMULATE_LATENCY
+    previous = SIMULATE_LATENCY
+    SIMULATE_LATENCY = False
+    try:
+        yield
+    finally:
+        SIMULATE_LATENCY = previous
+
+
+# Response timestamp shared by every mock called inside a pipeline_timestamp() block
+_PIPELINE_TIMESTAMP: ContextVar[Optional[str]] = ContextVar("pipeline_timestamp", default=None)
+
+
+def _now_iso() -> str:
+    """Response timestamp: the active pipeline timestamp, else the current time."""
+    timestamp = _PIPELINE_TIMESTAMP.get()
+    return timestamp if timestamp is not None else datetime.now().isoformat()
+
+
+@contextmanager
+def pipeline_timestamp(timestamp: Optional[str] = None) -> Iterator[str]:
+    """
+    Stamp every mock response produced in this block with one timestamp.
+    
+    An applicant evaluation calls several mocks back to back; this reads
+    and formats the clock once instead of once per response. Nested blocks
+    reuse the outer timestamp.
+    
+    Args:
+        timestamp: ISO timestamp to use (defaults to the current time)
+        
+    Yields:
+        The pipeline timestamp
+    """
+    stamp = timestamp if timestamp is not None else _now_iso()
+    token = _PIPELINE_TIMESTAMP.set(stamp)
+    try:
+        yield stamp
+    finally:
+        _PIPELINE_TIMESTAMP.reset(token)
+
+
+def _simulated_delay(low: float, high: float) -> float:
+    """Simulated API latency in seconds, or 0.0 when latency simulation is off."""
+    return _rng.uniform(low, high) if SIMULATE_LATENCY else 0.0
+
+
+@lru_cache(maxsize=1)
+def _recent_date_strings(day_ordinal: int) -> Tuple[str, ...]:
+    """
+    ISO dates for the 30 days before the given day, indexed by days ago.
+    
+    Keyed on the day's ordinal so the table is rebuilt once per day.
+    """
+    today = date.fromordinal(day_ordinal)
+    return tuple((today - timedelta(days=days_ago)).isoformat() for days_ago in range(31))
 
 
 def check_identity(ssn: str, name: str, address: str) -> Dict:
@@ -98,58 +297,35 @@ def check_identity(ssn: str, name: str, address: str) -> Dict:
         Dict with verification results
     """
     # Introduce some randomness for realistic simulation
-    response_delay = random.uniform(0.5, 2.0)  # Simulate API latency
+    response_delay = _simulated_delay(0.5, 2.0)  # Simulate API latency
     
     # Check if SSN is in our mock database
-    all_records = {**MOCK_IDENTITY_DATABASE["valid"], **MOCK_IDENTITY_DATABASE["suspicious"]}
+    template = _IDENTITY_RESPONSE_TEMPLATES.get(ssn)
     
-    if ssn in all_records:
-        record = all_records[ssn]
+    if template is not None:
+        name_lower, address_lower = _IDENTITY_MATCH_KEYS[ssn]
         
         # Add slight randomness to confidence scores
-        base_confidence = 0.95 if record["identity_verified"] else 0.40
-        confidence_variation = random.uniform(-0.05, 0.05)
-        confidence = max(0.0, min(1.0, base_confidence + confidence_variation))
+        base_confidence = 0.95 if template["ssn_valid"] else 0.40
+        confidence_variation = _rng.uniform(-0.05, 0.05)
+        # Base scores sit 0.05+ inside [0, 1], so no clamp is needed once rounded
+        confidence = base_confidence + confidence_variation
         
-        return {
-            "success": True,
-            "ssn": ssn,
-            "ssn_valid": record["identity_verified"],
-            "name_match": record["name"].lower() == name.lower(),
-            "address_match": record["address"].lower() in address.lower(),
-            "identity_theft_flags": record["identity_theft_flags"],
-            "address_history_months": record["address_history_months"],
-            "government_verified": record["government_verified"],
-            "confidence_score": round(confidence, 2),
-            "checks_passed": {
-                "ssn_validation": record["identity_verified"],
-                "identity_theft_check": not record["identity_theft_flags"],
-                "address_verification": record["address_history_months"] >= 6,
-                "government_database_check": record["government_verified"]
-            },
-            "timestamp": datetime.now().isoformat(),
-            "response_time_ms": int(response_delay * 1000)
-        }
+        response = template.copy()
+        response["name_match"] = name_lower == name.lower()
+        response["address_match"] = address_lower in address.lower()
+        response["confidence_score"] = round(confidence, 2)
+        response["checks_passed"] = dict(template["checks_passed"])
+        response["timestamp"] = _now_iso()
+        response["response_time_ms"] = int(response_delay * 1000)
+        return response
     else:
         # Unknown SSN - simulate not found scenario
         return {
-            "success": False,
+            **_IDENTITY_NOT_FOUND,
             "ssn": ssn,
-            "ssn_valid": False,
-            "name_match": False,
-            "address_match": False,
-            "identity_theft_flags": False,
-            "address_history_months": 0,
-            "government_verified": False,
-            "confidence_score": 0.0,
-            "checks_passed": {
-                "ssn_validation": False,
-                "identity_theft_check": True,
-                "address_verification": False,
-                "government_database_check": False
-            },
-            "error": "SSN not found in credit bureau records",
-            "timestamp": datetime.now().isoformat(),
+            "checks_passed": dict(_IDENTITY_NOT_FOUND["checks_passed"]),
+            "timestamp": _now_iso(),
             "response_time_ms": int(response_delay * 1000)
         }
 
@@ -178,7 +354,7 @@ def verify_income(
     Returns:
         Dict with income verification results
     """
-    response_delay = random.uniform(0.3, 1.5)
+    response_delay = _simulated_delay(0.3, 1.5)
     
     if ssn in MOCK_INCOME_DATABASE:
         record = MOCK_INCOME_DATABASE[ssn]
@@ -193,14 +369,16 @@ def verify_income(
         dti_ratio = None
         if total_debt_payments and monthly_income > 0:
             dti_ratio = round(total_debt_payments / monthly_income, 3)
+        dti_within_limit = dti_ratio < 0.43 if dti_ratio is not None else None
         
         # Employment stability check (need 3+ months)
         employment_stable = record["employment_months"] >= 3
         
         # Confidence calculation
         base_confidence = 0.85 if record["income_verified"] else 0.50
-        confidence_variation = random.uniform(-0.05, 0.05)
-        confidence = max(0.0, min(1.0, base_confidence + confidence_variation))
+        confidence_variation = _rng.uniform(-0.05, 0.05)
+        # Base scores sit 0.05+ inside [0, 1], so no clamp is needed once rounded
+        confidence = base_confidence + confidence_variation
         
         return {
             "success": True,
@@ -215,36 +393,24 @@ def verify_income(
             "employment_stable": employment_stable,
             "documentation_complete": record["documentation_complete"],
             "dti_ratio": dti_ratio,
-            "dti_within_limit": dti_ratio < 0.43 if dti_ratio else None,
+            "dti_within_limit": dti_within_limit,
             "confidence_score": round(confidence, 2),
             "checks_passed": {
-                "employment_verification": record["employment_status"] in ["full_time", "part_time"],
+                "employment_verification": record["employment_status"] in _ACCEPTED_EMPLOYMENT_STATUSES,
                 "income_documentation": record["documentation_complete"],
                 "income_stability": employment_stable,
-                "dti_calculation": dti_ratio < 0.43 if dti_ratio else True
+                "dti_calculation": dti_within_limit if dti_within_limit is not None else True
             },
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "response_time_ms": int(response_delay * 1000)
         }
     else:
         return {
-            "success": False,
+            **_INCOME_NOT_FOUND,
             "ssn": ssn,
             "stated_income": stated_income,
-            "verified_income": None,
-            "income_match": False,
-            "employment_stable": False,
-            "documentation_complete": False,
-            "dti_ratio": None,
-            "confidence_score": 0.0,
-            "checks_passed": {
-                "employment_verification": False,
-                "income_documentation": False,
-                "income_stability": False,
-                "dti_calculation": False
-            },
-            "error": "Unable to verify income - SSN not found",
-            "timestamp": datetime.now().isoformat(),
+            "checks_passed": dict(_INCOME_NOT_FOUND["checks_passed"]),
+            "timestamp": _now_iso(),
             "response_time_ms": int(response_delay * 1000)
         }
 
@@ -262,26 +428,20 @@ def check_ofac(ssn: str, name: str) -> Dict:
     Returns:
         Dict with OFAC screening results
     """
-    response_delay = random.uniform(0.2, 0.8)
+    response_delay = _simulated_delay(0.2, 0.8)
     
     # Check against mock OFAC list
     on_ofac_list = ssn in MOCK_OFAC_LIST
     
-    # Simulate name fuzzy matching
-    name_similarity = random.uniform(0.0, 0.3) if on_ofac_list else random.uniform(0.0, 0.1)
+    # Simulate name fuzzy matching; only a list hit needs a similarity score
+    name_similarity = _rng.uniform(0.0, 0.3) if on_ofac_list else 0.0
     
     return {
-        "success": True,
+        **(_OFAC_HIT_RESULT if on_ofac_list else _OFAC_MISS_RESULT),
         "ssn": ssn,
         "name": name,
-        "on_ofac_list": on_ofac_list,
-        "match_type": "exact" if on_ofac_list else "none",
         "name_similarity_score": round(name_similarity, 3),
-        "sanctions_found": on_ofac_list,
-        "screening_passed": not on_ofac_list,
-        "lists_checked": ["SDN", "Non-SDN", "Sectoral Sanctions"],
-        "confidence_score": 1.0 if not on_ofac_list else 0.0,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _now_iso(),
         "response_time_ms": int(response_delay * 1000)
     }
 
@@ -310,7 +470,7 @@ def check_fraud_indicators(
     Returns:
         Dict with fraud analysis results
     """
-    response_delay = random.uniform(0.5, 1.5)
+    response_delay = _simulated_delay(0.5, 1.5)
     
     # Check velocity (high-risk if SSN in velocity list or too many apps)
     high_velocity = ssn in MOCK_FRAUD_PATTERNS["high_velocity_ssns"] or application_count_30d > 3
@@ -319,14 +479,12 @@ def check_fraud_indicators(
     high_risk_ip = ip_address in MOCK_FRAUD_PATTERNS["high_risk_ips"] if ip_address else False
     
     # Simulate credit inquiry data
-    recent_inquiries = random.randint(0, 8) if high_velocity else random.randint(0, 2)
+    recent_inquiries = _rng.randint(0, 8) if high_velocity else _rng.randint(0, 2)
     inquiry_pattern_suspicious = recent_inquiries > 5
     
     # Generate synthetic credit bureau inquiry data
-    inquiry_dates = []
-    for i in range(recent_inquiries):
-        days_ago = random.randint(1, 30)
-        inquiry_dates.append((datetime.now() - timedelta(days=days_ago)).isoformat()[:10])
+    recent_dates = _recent_date_strings(date.today().toordinal())
+    inquiry_dates = [recent_dates[_rng.randint(1, 30)] for _ in range(recent_inquiries)]
     
     # Calculate fraud risk score
     fraud_indicators = []
@@ -371,7 +529,7 @@ def check_fraud_indicators(
                 "device_id": device_id,
                 "ip_address": ip_address,
                 "ip_risk_level": "high" if high_risk_ip else "low",
-                "device_match": random.choice([True, False]) if device_id else None
+                "device_match": bool(_rng.getrandbits(1)) if device_id else None
             }
         },
         "checks_passed": {
@@ -380,7 +538,99 @@ def check_fraud_indicators(
             "device_ip_check": not high_risk_ip
         },
         "screening_passed": len(fraud_indicators) == 0,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _now_iso(),
+        "response_time_ms": int(response_delay * 1000)
+    }
+
+
+def _draw_credit_fields(is_good_credit: bool) -> Dict:
+    """Draw the random values for one synthetic credit report."""
+    if is_good_credit:
+        credit_score = _rng.randint(680, 820)
+        payment_history_pct = _rng.uniform(0.92, 1.0)
+        delinquencies = _rng.randint(0, 1)
+    else:
+        credit_score = _rng.randint(520, 650)
+        payment_history_pct = _rng.uniform(0.65, 0.85)
+        delinquencies = _rng.randint(2, 5)
+    
+    # Generate account mix
+    num_accounts = _rng.randint(3, 12)
+    total_credit_limit = _rng.randint(15000, 75000)
+    
+    # Remaining fields in the order the report lists them
+    return {
+        "credit_score": credit_score,
+        "payment_history_pct": payment_history_pct,
+        "delinquencies": delinquencies,
+        "num_accounts": num_accounts,
+        "total_credit_limit": total_credit_limit,
+        "total_balance": _rng.randint(2000, int(total_credit_limit * 0.6)),
+        "closed_accounts": _rng.randint(0, 2),
+        "public_records": 0 if is_good_credit else _rng.randint(0, 2),
+        "inquiries_6m": _rng.randint(0, 3),
+        "inquiries_12m": _rng.randint(1, 5),
+        "oldest_account_months": _rng.randint(24, 180),
+        "revolving_balance": _rng.randint(500, 5000),
+        "revolving_limit": _rng.randint(5000, 15000),
+        "installment_balance": _rng.randint(10000, 25000),
+        "installment_limit": _rng.randint(20000, 35000),
+    }
+
+
+def _credit_report(ssn: str, fields: Dict, response_delay: float) -> Dict:
+    """Build a credit bureau response from drawn credit fields."""
+    total_credit_limit = fields["total_credit_limit"]
+    utilization = round(fields["total_balance"] / total_credit_limit, 3) if total_credit_limit > 0 else 0
+    
+    return {
+        "success": True,
+        "ssn": ssn,
+        "credit_score": fields["credit_score"],
+        "score_range": "300-850",
+        "score_factors": _CREDIT_SCORE_FACTORS,
+        "summary": {
+            "total_accounts": fields["num_accounts"],
+            "open_accounts": fields["num_accounts"] - fields["closed_accounts"],
+            "total_credit_limit": total_credit_limit,
+            "total_balance": fields["total_balance"],
+            "utilization_ratio": utilization,
+            "delinquencies": fields["delinquencies"],
+            "public_records": fields["public_records"],
+            "inquiries_6m": fields["inquiries_6m"],
+            "inquiries_12m": fields["inquiries_12m"],
+            "oldest_account_months": fields["oldest_account_months"],
+            "payment_history_pct": round(fields["payment_history_pct"], 3)
+        },
+        "tradelines": [
+            {
+                "type": "revolving",
+                "creditor": "Major Bank Credit Card",
+                "balance": fields["revolving_balance"],
+                "limit": fields["revolving_limit"],
+                "payment_status": "current"
+            },
+            {
+                "type": "installment",
+                "creditor": "Auto Loan",
+                "balance": fields["installment_balance"],
+                "limit": fields["installment_limit"],
+                "payment_status": "current"
+            }
+        ],
+        "timestamp": _now_iso(),
+        "response_time_ms": int(response_delay * 1000)
+    }
+
+
+def _no_credit_file(ssn: str, response_delay: float) -> Dict:
+    """Build the credit bureau response for an SSN with no credit file."""
+    return {
+        "success": False,
+        "ssn": ssn,
+        "error": "No credit file found",
+        "thin_file": True,
+        "timestamp": _now_iso(),
         "response_time_ms": int(response_delay * 1000)
     }
 
@@ -402,83 +652,85 @@ def get_credit_bureau_data(ssn: str) -> Dict:
     Returns:
         Dict with credit bureau report
     """
-    response_delay = random.uniform(1.0, 2.5)
+    response_delay = _simulated_delay(1.0, 2.5)
     
     # Generate synthetic credit data
-    all_records = {**MOCK_IDENTITY_DATABASE["valid"], **MOCK_IDENTITY_DATABASE["suspicious"]}
-    
-    if ssn in all_records:
+    if ssn in _ALL_IDENTITY_RECORDS:
         # Generate realistic credit score based on identity status
-        is_good_credit = ssn in MOCK_IDENTITY_DATABASE["valid"]
-        
-        if is_good_credit:
-            credit_score = random.randint(680, 820)
-            payment_history_pct = random.uniform(0.92, 1.0)
-            delinquencies = random.randint(0, 1)
-        else:
-            credit_score = random.randint(520, 650)
-            payment_history_pct = random.uniform(0.65, 0.85)
-            delinquencies = random.randint(2, 5)
-        
-        # Generate account mix
-        num_accounts = random.randint(3, 12)
-        total_credit_limit = random.randint(15000, 75000)
-        total_balance = random.randint(2000, int(total_credit_limit * 0.6))
-        utilization = round(total_balance / total_credit_limit, 3) if total_credit_limit > 0 else 0
-        
-        return {
-            "success": True,
-            "ssn": ssn,
-            "credit_score": credit_score,
-            "score_range": "300-850",
-            "score_factors": [
-                "Payment History (35%)",
-                "Credit Utilization (30%)",
-                "Length of Credit History (15%)",
-                "Credit Mix (10%)",
-                "New Credit (10%)"
-            ],
-            "summary": {
-                "total_accounts": num_accounts,
-                "open_accounts": num_accounts - random.randint(0, 2),
-                "total_credit_limit": total_credit_limit,
-                "total_balance": total_balance,
-                "utilization_ratio": utilization,
-                "delinquencies": delinquencies,
-                "public_records": 0 if is_good_credit else random.randint(0, 2),
-                "inquiries_6m": random.randint(0, 3),
-                "inquiries_12m": random.randint(1, 5),
-                "oldest_account_months": random.randint(24, 180),
-                "payment_history_pct": round(payment_history_pct, 3)
-            },
-            "tradelines": [
-                {
-                    "type": "revolving",
-                    "creditor": "Major Bank Credit Card",
-                    "balance": random.randint(500, 5000),
-                    "limit": random.randint(5000, 15000),
-                    "payment_status": "current"
-                },
-                {
-                    "type": "installment",
-                    "creditor": "Auto Loan",
-                    "balance": random.randint(10000, 25000),
-                    "limit": random.randint(20000, 35000),
-                    "payment_status": "current"
-                }
-            ],
-            "timestamp": datetime.now().isoformat(),
-            "response_time_ms": int(response_delay * 1000)
-        }
+        fields = _draw_credit_fields(ssn in _VALID_SSN_SET)
+        return _credit_report(ssn, fields, response_delay)
     else:
-        return {
-            "success": False,
-            "ssn": ssn,
-            "error": "No credit file found",
-            "thin_file": True,
-            "timestamp": datetime.now().isoformat(),
-            "response_time_ms": int(response_delay * 1000)
-        }
+        return _no_credit_file(ssn, response_delay)
+
+
+def get_credit_bureau_data_batch(ssns: List[str]) -> List[Dict]:
+    """
+    Mock credit bureau data retrieval for many applicants at once.
+    
+    Draws each random report field for the whole batch in one vectorized
+    NumPy call, for portfolio-scale simulation. Falls back to per-SSN draws
+    when NumPy is not installed.
+    
+    Args:
+        ssns: Social Security Numbers
+        
+    Returns:
+        List of credit bureau reports, in the same order as ssns
+    """
+    if not HAS_NUMPY:
+        with pipeline_timestamp():
+            return [
+                _credit_report(ssn, _draw_credit_fields(ssn in _VALID_SSN_SET), _simulated_delay(1.0, 2.5))
+                if ssn in _ALL_IDENTITY_RECORDS else _no_credit_file(ssn, _simulated_delay(1.0, 2.5))
+                for ssn in ssns
+            ]
+    
+    # Seeded from the module random source, so set_seed() also fixes batch draws
+    rng = np.random.default_rng(_rng.getrandbits(64))
+    n = len(ssns)
+    good = np.fromiter((ssn in _VALID_SSN_SET for ssn in ssns), dtype=bool, count=n)
+    total_credit_limit = rng.integers(15000, 75001, n)
+    
+    # Integer bounds below are exclusive, unlike random.randint
+    columns = {
+        "credit_score": np.where(good, rng.integers(680, 821, n), rng.integers(520, 651, n)),
+        "payment_history_pct": np.where(good, rng.uniform(0.92, 1.0, n), rng.uniform(0.65, 0.85, n)),
+        "delinquencies": np.where(good, rng.integers(0, 2, n), rng.integers(2, 6, n)),
+        "num_accounts": rng.integers(3, 13, n),
+        "closed_accounts": rng.integers(0, 3, n),
+        "total_credit_limit": total_credit_limit,
+        "total_balance": rng.integers(2000, (total_credit_limit * 0.6).astype(np.int64) + 1),
+        "public_records": np.where(good, 0, rng.integers(0, 3, n)),
+        "inquiries_6m": rng.integers(0, 4, n),
+        "inquiries_12m": rng.integers(1, 6, n),
+        "oldest_account_months": rng.integers(24, 181, n),
+        "revolving_balance": rng.integers(500, 5001, n),
+        "revolving_limit": rng.integers(5000, 15001, n),
+        "installment_balance": rng.integers(10000, 25001, n),
+        "installment_limit": rng.integers(20000, 35001, n),
+    }
+    response_delays = rng.uniform(1.0, 2.5, n) if SIMULATE_LATENCY else np.zeros(n)
+    
+    # Convert to Python scalars once per column rather than per element
+    rows = {name: column.tolist() for name, column in columns.items()}
+    response_delays = response_delays.tolist()
+    
+    reports = []
+    with pipeline_timestamp():
+        for i, ssn in enumerate(ssns):
+            if ssn in _ALL_IDENTITY_RECORDS:
+                fields = {name: column[i] for name, column in rows.items()}
+                reports.append(_credit_report(ssn, fields, response_delays[i]))
+            else:
+                reports.append(_no_credit_file(ssn, response_delays[i]))
+    return reports
+
+
+def _format_response(result: Dict) -> str:
+    """Pretty-print a mock response as JSON, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(result, indent=2)
 
 
 # Helper function to get test SSNs for demos
@@ -508,24 +760,24 @@ if __name__ == "__main__":
     print("\n1. Identity Check:")
     print("-" * 70)
     result = check_identity(test_ssn, "John Doe", "123 Main St, New York, NY")
-    print(json.dumps(result, indent=2))
+    print(_format_response(result))
     
     print("\n2. Income Verification:")
     print("-" * 70)
     result = verify_income(test_ssn, 85000, "Tech Corp Inc", 2500)
-    print(json.dumps(result, indent=2))
+    print(_format_response(result))
     
     print("\n3. OFAC Check:")
     print("-" * 70)
     result = check_ofac(test_ssn, "John Doe")
-    print(json.dumps(result, indent=2))
+    print(_format_response(result))
     
     print("\n4. Fraud Indicators:")
     print("-" * 70)
     result = check_fraud_indicators(test_ssn, "device-123", "192.168.1.1", 2)
-    print(json.dumps(result, indent=2))
+    print(_format_response(result))
     
     print("\n5. Credit Bureau Data:")
     print("-" * 70)
     result = get_credit_bureau_data(test_ssn)
-    print(json.dumps(result, indent=2))
+    print(_format_response(result))
@@ -6,19 +6,143 @@ semi-structured JSON rules for fast runtime lookup, eliminating the need
 for vector DB queries during application processing.
 """
 
+import hashlib
 import json
 import logging
-from typing import Dict, List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 from pydantic import BaseModel, Field
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
+from openai import OpenAI
 from langchain_openai import ChatOpenAI
+from langchain_core.messages import SystemMessage, convert_to_openai_messages
 from langchain_core.prompts import ChatPromptTemplate
-from config import settings
+from config import get_settings
 from tools.vector_store import PolicyVectorStore
 
 logger = logging.getLogger(__name__)
 
+# Static extraction instructions. These are sent as the system message, ahead of
+# the policy text, so every extraction request shares the same cacheable prefix.
+_RULE_JSON_EXAMPLE = """{
+  "description": "Policy description",
+  "risk_level": "HIGH",
+  "required_agents": ["identity"],
+  "checks": [
+    {
+      "name": "ssn_validation",
+      "description": "Verify SSN",
+      "tool": "check_identity",
+      "required": true,
+      "threshold": null,
+      "zero_tolerance": false
+    }
+  ],
+  "decision_criteria": {
+    "approval_condition": "all_checks_pass",
+    "min_confidence": 0.8,
+    "dti_threshold": null,
+    "zero_tolerance_checks": [],
+    "requires_manual_signoff": false
+  },
+  "workflow_config": {
+    "parallel_execution": false,
+    "timeout_seconds": 30,
+    "retry_on_failure": true,
+    "cascade_mode": false
+  }
+}"""
+
+_EXTRACTION_INSTRUCTIONS = """You are an expert at analyzing underwriting policy documents and extracting structured information.
+
+The user will send a policy document. Extract and structure the information into JSON format.
+
+Extract the following information:
+1. Description
+2. Risk level (LOW, MEDIUM, HIGH, or CRITICAL)
+3. Required agents (identity, income, fraud, or combination)
+4. Individual checks required
+5. Decision criteria
+6. Workflow configuration
+
+For each check, identify:
+- Check name (snake_case)
+- Description
+- Tool/API to use (check_identity, verify_income, check_fraud_indicators, check_ofac, etc.)
+- Whether it's required
+- Any thresholds (e.g., DTI < 43%)
+- Zero tolerance flags
+
+Respond with JSON in this format:
+""" + _RULE_JSON_EXAMPLE
+
+_BATCH_EXTRACTION_INSTRUCTIONS = """You are an expert at analyzing underwriting policy documents and extracting structured information.
+
+The user will send several policy documents, each wrapped in a <POLICY id="..."> block. Extract one structured rule per policy.
+
+For each policy, extract the same information and use the same per-rule JSON format as a single-policy extraction:
+description, risk level (LOW, MEDIUM, HIGH, or CRITICAL), required agents (identity, income, fraud),
+checks (name in snake_case, description, tool, required, threshold, zero_tolerance), decision criteria and workflow configuration.
+Set "rule_name" to the policy's id.
+
+Respond with JSON in this format, with one entry in "rules" per policy:
+{"rules": [<rule>, ...]}
+
+where each <rule> has this format, plus a "rule_name" field:
+""" + _RULE_JSON_EXAMPLE
+
+
+# Prompt templates are immutable, so they are built once at import
+_EXTRACTION_PROMPT = ChatPromptTemplate.from_messages([
+    SystemMessage(content=_EXTRACTION_INSTRUCTIONS),
+    ("human", "Policy Document:\n{policy_text}")
+])
+
+_BATCH_EXTRACTION_PROMPT = ChatPromptTemplate.from_messages([
+    SystemMessage(content=_BATCH_EXTRACTION_INSTRUCTIONS),
+    ("human", "{policy_blocks}")
+])
+
+
+def _read_json(filepath: str) -> Dict:
+    """Parse a JSON file, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.loads(Path(filepath).read_bytes())
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json(data: Dict, filepath: str) -> None:
+    """Write data as indented UTF-8 JSON, using orjson when available."""
+    if HAS_ORJSON:
+        Path(filepath).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def _policy_hash(policy_text: str) -> str:
+    """Content hash of a policy's text, used to detect unchanged policies."""
+    return hashlib.md5(policy_text.encode()).hexdigest()
+
+
+# Batch API statuses after which a batch no longer changes
+_BATCH_FINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+def _hashes_path(filepath: str) -> Path:
+    """Sidecar file holding the policy hashes for a rules file."""
+    return Path(filepath).with_suffix(".hashes.json")
+
 
 # Pydantic models for structured rules
 class CheckConfig(BaseModel):
@@ -58,6 +182,92 @@ class StructuredRule(BaseModel):
     workflow_config: WorkflowConfig = Field(..., description="Workflow configuration")
 
 
+class ExtractedRule(StructuredRule):
+    """Structured rule as returned by batched extraction, tagged with its policy id."""
+    rule_name: str = Field(..., description="Review rule name (the policy id)")
+
+
+class ExtractedRules(BaseModel):
+    """Response schema for batched rule extraction."""
+    rules: List[ExtractedRule] = Field(..., description="One structured rule per policy")
+
+
+RuleEvaluator = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+def _compile_rule(rule: StructuredRule) -> RuleEvaluator:
+    """
+    Compile a structured rule into an evaluator function.
+    
+    Everything that depends only on the rule (required and zero tolerance
+    check names, thresholds) is resolved once here, so evaluating an
+    application only reads the check results.
+    
+    Only check results, the DTI threshold and min_confidence are enforced.
+    The approval condition and per-check thresholds are free-form text
+    produced by extraction, so they are returned for the caller to apply,
+    not evaluated. A rule that requires manual sign-off never passes on
+    its own; "checks_passed" reports the automated outcome.
+    
+    Args:
+        rule: Structured rule to compile
+        
+    Returns:
+        Function taking check results keyed by check name (True if the check
+        passed), plus optional "dti" and "confidence" values, and returning
+        the rule outcome along with the rule's approval condition and
+        per-check thresholds
+    """
+    zero_tolerance_checks = frozenset(
+        [check.name for check in rule.checks if check.zero_tolerance]
+        + rule.decision_criteria.zero_tolerance_checks
+    )
+    # Required checks must pass; zero tolerance checks that are not required
+    # only fail when a result is reported for them
+    evaluated_checks = tuple(
+        (check.name, check.required) for check in rule.checks
+        if check.required or check.name in zero_tolerance_checks
+    )
+    checked_names = {name for name, _ in evaluated_checks}
+    evaluated_checks += tuple(
+        (name, False) for name in dict.fromkeys(rule.decision_criteria.zero_tolerance_checks)
+        if name not in checked_names
+    )
+    thresholds = {check.name: check.threshold for check in rule.checks if check.threshold is not None}
+    approval_condition = rule.decision_criteria.approval_condition
+    dti_threshold = rule.decision_criteria.dti_threshold
+    min_confidence = rule.decision_criteria.min_confidence
+    requires_manual_signoff = rule.decision_criteria.requires_manual_signoff
+    
+    def evaluate(results: Dict[str, Any]) -> Dict[str, Any]:
+        # A required check with no result counts as failed
+        failed_checks = [
+            name for name, required in evaluated_checks
+            if not results.get(name) and (required or name in results)
+        ]
+        
+        dti = results.get("dti")
+        if dti_threshold is not None and dti is not None and dti >= dti_threshold:
+            failed_checks.append("dti_threshold")
+        
+        confidence = results.get("confidence")
+        confidence_met = confidence is None or confidence >= min_confidence
+        
+        checks_passed = not failed_checks and confidence_met
+        return {
+            "passed": checks_passed and not requires_manual_signoff,
+            "checks_passed": checks_passed,
+            "failed_checks": failed_checks,
+            "zero_tolerance_failure": not zero_tolerance_checks.isdisjoint(failed_checks),
+            "confidence_met": confidence_met,
+            "requires_manual_signoff": requires_manual_signoff,
+            "approval_condition": approval_condition,
+            "thresholds": dict(thresholds)
+        }
+    
+    return evaluate
+
+
 class PolicyExecutor:
     """
     Policy Executor converts natural language policies into structured rules.
@@ -75,7 +285,16 @@ class PolicyExecutor:
         """
         self.vector_store = vector_store
         self.structured_rules: Dict[str, StructuredRule] = {}
+        self.rules: Dict[str, Dict] = {}
+        # Hash of the policy text each structured rule was generated from
+        self.policy_hashes: Dict[str, str] = {}
+        # Compiled evaluators, each with the rule it was built from
+        self._evaluators: Dict[str, Tuple[StructuredRule, RuleEvaluator]] = {}
         self.llm = None
+        self.rule_llm = None
+        self.batch_rule_llm = None
+        # OpenAI client for the Batch API (files and batches endpoints)
+        self.batch_client = None
         
         logger.info("PolicyExecutor initialized")
     
@@ -89,79 +308,41 @@ class PolicyExecutor:
         self.vector_store = vector_store
         
         # Initialize LLM for rule generation
+        settings = get_settings()
         self.llm = ChatOpenAI(
             model=settings.openai_model,
             temperature=0.1,  # Low temperature for consistent extraction
             openai_api_key=settings.openai_api_key
         )
         
+        # Schema-constrained variants: responses are guaranteed to parse into the models
+        self.rule_llm = self.llm.with_structured_output(StructuredRule, method="json_schema", strict=True)
+        self.batch_rule_llm = self.llm.with_structured_output(ExtractedRules, method="json_schema", strict=True)
+        self.batch_client = OpenAI(api_key=settings.openai_api_key)
+        
         logger.info("PolicyExecutor initialized with vector store and LLM")
     
     def _create_extraction_prompt(self) -> ChatPromptTemplate:
         """
-        Create prompt template for extracting structured rules from policies.
+        Get the shared prompt template for extracting structured rules from policies.
+        
+        The static instructions are the system message and the policy text is
+        the only content of the human message, so the prompt prefix is identical
+        across policies and eligible for provider-side prompt caching.
         
         Returns:
             ChatPromptTemplate for rule extraction
         """
-        template = """You are an expert at analyzing underwriting policy documents and extracting structured information.
-
-Given the following policy document, extract and structure the information into JSON format.
-
-Policy Document:
-{policy_text}
-
-Extract the following information:
-1. Review rule name (from REVIEW_RULE: line)
-2. Description
-3. Risk level (LOW, MEDIUM, HIGH, or CRITICAL)
-4. Required agents (identity, income, fraud, or combination)
-5. Individual checks required
-6. Decision criteria
-7. Workflow configuration
-
-For each check, identify:
-- Check name (snake_case)
-- Description
-- Tool/API to use (check_identity, verify_income, check_fraud_indicators, check_ofac, etc.)
-- Whether it's required
-- Any thresholds (e.g., DTI < 43%)
-- Zero tolerance flags
-
-Respond with ONLY valid JSON in this exact format:
-{{
-  "rule_name": "IDENTITY_VERIFICATION",
-  "description": "Policy description",
-  "risk_level": "HIGH",
-  "required_agents": ["identity"],
-  "checks": [
-    {{
-      "name": "ssn_validation",
-      "description": "Verify SSN",
-      "tool": "check_identity",
-      "required": true,
-      "threshold": null,
-      "zero_tolerance": false
-    }}
-  ],
-  "decision_criteria": {{
-    "approval_condition": "all_checks_pass",
-    "min_confidence": 0.8,
-    "dti_threshold": null,
-    "zero_tolerance_checks": [],
-    "requires_manual_signoff": false
-  }},
-  "workflow_config": {{
-    "parallel_execution": false,
-    "timeout_seconds": 30,
-    "retry_on_failure": true,
-    "cascade_mode": false
-  }}
-}}
-
-JSON:"""
+        return _EXTRACTION_PROMPT
+    
+    def _create_batch_extraction_prompt(self) -> ChatPromptTemplate:
+        """
+        Get the shared prompt template for extracting structured rules from several policies at once.
         
-        return ChatPromptTemplate.from_template(template)
+        Returns:
+            ChatPromptTemplate for batched rule extraction
+        """
+        return _BATCH_EXTRACTION_PROMPT
     
     def _parse_policy_to_rule(self, policy_text: str, review_rule: str) -> Optional[StructuredRule]:
         """
@@ -177,71 +358,80 @@ JSON:"""
         try:
             prompt = self._create_extraction_prompt()
             
-            # Generate structured data using LLM
+            # Generate structured rule using schema-constrained LLM output
             messages = prompt.format_messages(policy_text=policy_text)
-            response = self.llm.invoke(messages)
-            
-            logger.debug(f"LLM Response for {review_rule}: {response.content[:200]}")
-            
-            # Parse JSON response - handle potential markdown wrapping
-            content = response.content.strip()
-            
-            # Remove markdown code blocks if present
-            if content.startswith("```json"):
-                content = content[7:]  # Remove ```json
-            if content.startswith("```"):
-                content = content[3:]  # Remove ```
-            if content.endswith("```"):
-                content = content[:-3]  # Remove trailing ```
-            
-            content = content.strip()
-            
-            # Parse JSON
-            rule_data = json.loads(content)
-            
-            # Handle case where LLM returns an array
-            if isinstance(rule_data, list):
-                # Find the matching rule
-                for item in rule_data:
-                    if item.get("rule_name", "").upper() == review_rule.upper():
-                        rule_data = item
-                        break
-                else:
-                    # If no match found, use first item
-                    if rule_data:
-                        rule_data = rule_data[0]
-                    else:
-                        logger.error(f"No rule data found in array for {review_rule}")
-                        return None
-            
-            # Convert to Pydantic model
-            structured_rule = StructuredRule(
-                description=rule_data["description"],
-                risk_level=rule_data["risk_level"],
-                required_agents=rule_data["required_agents"],
-                checks=[CheckConfig(**check) for check in rule_data["checks"]],
-                decision_criteria=DecisionCriteria(**rule_data["decision_criteria"]),
-                workflow_config=WorkflowConfig(**rule_data["workflow_config"])
-            )
+            structured_rule = self.rule_llm.invoke(messages)
             
             logger.info(f"Successfully parsed policy for {review_rule}")
             return structured_rule
             
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON for {review_rule}: {e}")
-            logger.error(f"LLM response: {response.content if 'response' in locals() else 'N/A'}")
-            return None
         except Exception as e:
             logger.error(f"Error parsing policy {review_rule}: {e}")
-            logger.error(f"Response content: {response.content[:500] if 'response' in locals() else 'N/A'}")
             import traceback
             logger.error(traceback.format_exc())
             return None
     
-    def generate_structured_rules(self) -> Dict[str, Dict]:
+    def _batch_extract(self, policies: List[Tuple[str, str]]) -> Dict[str, StructuredRule]:
+        """
+        Parse several policies into structured rules with a single LLM call.
+        
+        Policies missing from the batched response, or whose rule fails to
+        parse, fall back to a single-policy call.
+        
+        Args:
+            policies: List of (review_rule, policy_text) pairs
+            
+        Returns:
+            Dictionary of structured rules keyed by review rule name
+        """
+        if len(policies) == 1:
+            review_rule, policy_text = policies[0]
+            structured_rule = self._parse_policy_to_rule(policy_text, review_rule)
+            return {review_rule: structured_rule} if structured_rule else {}
+        
+        policy_blocks = "\n\n".join(
+            f'<POLICY id="{review_rule}">\n{policy_text}\n</POLICY>'
+            for review_rule, policy_text in policies
+        )
+        
+        rules_by_name = {}
+        try:
+            messages = self._create_batch_extraction_prompt().format_messages(policy_blocks=policy_blocks)
+            response = self.batch_rule_llm.invoke(messages)
+            
+            rules_by_name = {
+                item.rule_name.upper(): StructuredRule(**item.model_dump(exclude={"rule_name"}))
+                for item in response.rules
+            }
+        except Exception as e:
+            logger.warning(f"Batch extraction failed, falling back to single-policy calls: {e}")
+        
+        structured_rules = {}
+        for review_rule, policy_text in policies:
+            structured_rule = rules_by_name.get(review_rule.upper())
+            
+            if structured_rule is None:
+                structured_rule = self._parse_policy_to_rule(policy_text, review_rule)
+            else:
+                logger.info(f"Successfully parsed policy for {review_rule}")
+            
+            if structured_rule:
+                structured_rules[review_rule] = structured_rule
+        
+        return structured_rules
+    
+    def generate_structured_rules(self, force: bool = False) -> Dict[str, Dict]:
         """
         Generate structured rules from all policies in vector store.
         
+        Policies whose text is unchanged since their rule was generated
+        (same content hash) reuse the existing rule without an LLM call.
+        If no rules are loaded yet, the rules previously saved to the
+        configured structured_rules_path are loaded to provide those hashes.
+        
+        Args:
+            force: If True, regenerate every rule even if its policy is unchanged
+            
         Returns:
             Dictionary of structured rules keyed by review rule name
         """
@@ -253,35 +443,258 @@ JSON:"""
         
         logger.info("Generating structured rules from policies...")
         
-        # Get all policy names
-        policy_names = self.vector_store.list_all_policies()
-        logger.info(f"Found {len(policy_names)} policies to process")
+        policies, policy_hashes, reused_rules = self._pending_policies(force)
         
-        generated_rules = {}
+        # Parse policies to structured rules, several per LLM call
+        settings = get_settings()
+        batch_size = max(1, settings.rule_extraction_batch_size)
+        batches = [policies[start:start + batch_size] for start in range(0, len(policies), batch_size)]
+        parsed_rules = {}
         
-        for review_rule in policy_names:
-            logger.info(f"Processing policy: {review_rule}")
+        # LLM calls are network-bound, so overlap batches up to the concurrency limit
+        workers = min(len(batches), max(1, settings.rule_extraction_concurrency))
+        if workers <= 1:
+            for batch in batches:
+                parsed_rules.update(self._batch_extract(batch))
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for batch_rules in pool.map(self._batch_extract, batches):
+                    parsed_rules.update(batch_rules)
+        
+        parsed_rules.update(reused_rules)
+        return self._store_rules(parsed_rules, policy_hashes)
+    
+    def _pending_policies(
+        self,
+        force: bool
+    ) -> Tuple[List[Tuple[str, str]], Dict[str, str], Dict[str, StructuredRule]]:
+        """
+        Read every policy and split off the ones whose rule can be reused.
+        
+        Args:
+            force: If True, no rule is reused
             
-            # Get complete policy text
-            policy_text = self.vector_store.get_policy_by_rule(review_rule)
+        Returns:
+            Tuple of (review_rule, policy_text) pairs that need extraction,
+            the hash of every policy's text, and the reused rules
+        """
+        if not force:
+            self._load_saved_rules()
+        
+        # Get all policy texts in one bulk read (no per-policy embedding query)
+        policies_by_rule = self.vector_store.dump_policies_by_rule()
+        logger.info(f"Found {len(policies_by_rule)} policies to process")
+        
+        policies = []
+        policy_hashes = {}
+        reused_rules = {}
+        
+        for review_rule, policy_text in policies_by_rule.items():
+            logger.info(f"Processing policy: {review_rule}")
             
             if not policy_text:
                 logger.warning(f"No policy found for {review_rule}")
                 continue
             
-            # Parse policy to structured rule
-            structured_rule = self._parse_policy_to_rule(policy_text, review_rule)
+            # Skip the LLM for policies unchanged since their rule was generated
+            policy_hashes[review_rule] = _policy_hash(policy_text)
+            if (
+                not force
+                and review_rule in self.structured_rules
+                and self.policy_hashes.get(review_rule) == policy_hashes[review_rule]
+            ):
+                logger.info(f"Policy unchanged, reusing structured rule for {review_rule}")
+                reused_rules[review_rule] = self.structured_rules[review_rule]
+                continue
+            
+            policies.append((review_rule, policy_text))
+        
+        return policies, policy_hashes, reused_rules
+    
+    def _store_rules(self, parsed_rules: Dict[str, StructuredRule], policy_hashes: Dict[str, str]) -> Dict[str, Dict]:
+        """
+        Record generated rules along with the hash of the policy each came from.
+        
+        Args:
+            parsed_rules: Structured rules keyed by review rule name
+            policy_hashes: Policy text hash for every processed review rule
+            
+        Returns:
+            Dictionary of the stored rules as dicts, keyed by review rule name
+        """
+        generated_rules = {}
+        
+        for review_rule in policy_hashes:
+            structured_rule = parsed_rules.get(review_rule)
             
             if structured_rule:
                 # Store as dict for JSON serialization
                 self.structured_rules[review_rule] = structured_rule
+                self.policy_hashes[review_rule] = policy_hashes[review_rule]
                 generated_rules[review_rule] = structured_rule.model_dump()
+                self.rules[review_rule] = structured_rule.model_dump()
             else:
                 logger.warning(f"Failed to generate structured rule for {review_rule}")
         
         logger.info(f"Successfully generated {len(generated_rules)} structured rules")
         return generated_rules
     
+    def submit_rules_batch(self, force: bool = False) -> Optional[str]:
+        """
+        Submit rule extraction for changed policies to the OpenAI Batch API.
+        
+        Rule generation is an offline pass, so it can use the Batch API's
+        lower pricing and separate rate limits. One single-policy extraction
+        request is submitted per policy whose text changed since its rule was
+        generated; collect the results later with collect_rules_batch().
+        
+        Args:
+            force: If True, submit every policy even if it is unchanged
+            
+        Returns:
+            Batch id, or None if no policy needs extraction
+        """
+        self._check_initialized()
+        
+        policies, _, _ = self._pending_policies(force)
+        if not policies:
+            logger.info("No changed policies to submit")
+            return None
+        
+        # One chat completion request per policy, keyed by review rule
+        model = get_settings().openai_model
+        prompt = self._create_extraction_prompt()
+        lines = []
+        for review_rule, policy_text in policies:
+            lines.append(json.dumps({
+                "custom_id": review_rule,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": model,
+                    "temperature": 0.1,
+                    "response_format": {"type": "json_object"},
+                    "messages": convert_to_openai_messages(prompt.format_messages(policy_text=policy_text)),
+                },
+            }))
+        
+        input_file = self.batch_client.files.create(
+            file=("rule_extraction_requests.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = self.batch_client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info(f"Submitted {len(policies)} policies as rule extraction batch {batch.id}")
+        return batch.id
+    
+    def collect_rules_batch(self, batch_id: str, force: bool = False) -> Optional[Dict[str, Dict]]:
+        """
+        Collect the results of a batch from submit_rules_batch().
+        
+        Unchanged policies reuse their rule as in generate_structured_rules.
+        Rules the batch doesn't return (failed requests, a failed or expired
+        batch, or policies changed since submission) fall back to real-time calls.
+        
+        Args:
+            batch_id: Id returned by submit_rules_batch()
+            force: Must match the value the batch was submitted with
+            
+        Returns:
+            Dictionary of structured rules keyed by review rule name, or None
+            if the batch is still running
+        """
+        self._check_initialized()
+        
+        batch = self.batch_client.batches.retrieve(batch_id)
+        if batch.status not in _BATCH_FINAL_STATUSES:
+            logger.info(f"Batch {batch_id} is still {batch.status}")
+            return None
+        
+        contents = {}
+        if batch.status == "completed" and batch.output_file_id:
+            for line in self.batch_client.files.content(batch.output_file_id).text.splitlines():
+                result = json.loads(line)
+                response = result.get("response") or {}
+                if response.get("status_code") == 200:
+                    contents[result["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+        else:
+            logger.warning(f"Batch {batch_id} ended with status {batch.status}")
+        
+        policies, policy_hashes, parsed_rules = self._pending_policies(force)
+        for review_rule, policy_text in policies:
+            structured_rule = None
+            
+            if review_rule in contents:
+                try:
+                    structured_rule = StructuredRule.model_validate_json(contents[review_rule])
+                except Exception as e:
+                    logger.warning(f"Invalid batch result for {review_rule}: {e}")
+            
+            # Fall back to the real-time path
+            if structured_rule is None:
+                structured_rule = self._parse_policy_to_rule(policy_text, review_rule)
+            
+            if structured_rule:
+                parsed_rules[review_rule] = structured_rule
+        
+        return self._store_rules(parsed_rules, policy_hashes)
+    
+    def generate_structured_rules_batch(
+        self,
+        force: bool = False,
+        poll_interval_seconds: float = 30.0,
+        timeout_seconds: float = 15 * 60
+    ) -> Dict[str, Dict]:
+        """
+        Generate structured rules through the OpenAI Batch API and wait for them.
+        
+        Submits a batch, polls it until it finishes, then collects it. If the
+        batch misses the timeout it is cancelled and the rules are generated
+        with real-time calls instead. For longer waits, call
+        submit_rules_batch() and collect_rules_batch() separately.
+        
+        Args:
+            force: If True, regenerate every rule even if its policy is unchanged
+            poll_interval_seconds: Seconds between batch status checks
+            timeout_seconds: Maximum seconds to wait for the batch
+            
+        Returns:
+            Dictionary of structured rules keyed by review rule name
+        """
+        batch_id = self.submit_rules_batch(force=force)
+        if batch_id is None:
+            return self.generate_structured_rules(force=force)
+        
+        deadline = time.monotonic() + timeout_seconds
+        while True:
+            generated_rules = self.collect_rules_batch(batch_id, force=force)
+            if generated_rules is not None:
+                return generated_rules
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(poll_interval_seconds)
+        
+        logger.warning(f"Batch {batch_id} not finished after {timeout_seconds}s, cancelling")
+        self.batch_client.batches.cancel(batch_id)
+        return self.generate_structured_rules(force=force)
+    
+    def _check_initialized(self) -> None:
+        """Raise if initialize() has not set up the vector store and LLM."""
+        if not self.vector_store:
+            raise RuntimeError("Vector store not initialized. Call initialize() first.")
+        
+        if not self.llm:
+            raise RuntimeError("LLM not initialized. Call initialize() first.")
+    
+    def _load_saved_rules(self) -> None:
+        """Load the saved rules file, if nothing is loaded yet, so unchanged policies can be skipped."""
+        rules_path = get_settings().structured_rules_path
+        if not self.structured_rules and Path(rules_path).exists():
+            self.load_rules(rules_path)
+    
     def save_rules(self, filepath: str) -> None:
         """
         Save structured rules to JSON file.
@@ -303,8 +716,16 @@ JSON:"""
         Path(filepath).parent.mkdir(parents=True, exist_ok=True)
         
         # Save to JSON
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(rules_dict, f, indent=2, ensure_ascii=False)
+        _write_json(rules_dict, filepath)
+        
+        # Policy hashes go in a sidecar file so the rules file format is unchanged
+        policy_hashes = {
+            rule_name: self.policy_hashes[rule_name]
+            for rule_name in rules_dict
+            if rule_name in self.policy_hashes
+        }
+        if policy_hashes:
+            _write_json(policy_hashes, str(_hashes_path(filepath)))
         
         logger.info(f"Saved {len(rules_dict)} structured rules to {filepath}")
     
@@ -319,14 +740,18 @@ JSON:"""
             Dictionary of structured rules
         """
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                rules_dict = json.load(f)
+            rules_dict = _read_json(filepath)
             
             # Convert to Pydantic models
             self.structured_rules = {
-                rule_name: StructuredRule(**rule_data)
+                rule_name: StructuredRule.model_validate(rule_data)
                 for rule_name, rule_data in rules_dict.items()
             }
+            self.rules = rules_dict
+            
+            # Policy hashes from the sidecar file, if the rules were saved with one
+            hashes_path = _hashes_path(filepath)
+            self.policy_hashes = _read_json(str(hashes_path)) if hashes_path.exists() else {}
             
             logger.info(f"Loaded {len(self.structured_rules)} structured rules from {filepath}")
             return self.structured_rules
@@ -352,14 +777,11 @@ JSON:"""
             logger.warning(f"No structured rule found for {review_rule}")
             return None
         
-        rule = self.structured_rules[review_rule]
         return {
             "review_rule": review_rule,
-            "description": rule.description,
-            "risk_level": rule.risk_level,
-            "required_agents": rule.required_agents,
-            "checks": [check.model_dump() for check in rule.checks],
-            "workflow_config": rule.workflow_config.model_dump()
+            **self.structured_rules[review_rule].model_dump(
+                include={"description", "risk_level", "required_agents", "checks", "workflow_config"}
+            )
         }
     
     def get_decision_criteria(self, review_rule: str) -> Optional[Dict]:
@@ -390,6 +812,31 @@ JSON:"""
         """
         return self.structured_rules.get(review_rule)
     
+    def get_rule_evaluator(self, review_rule: str) -> Optional[RuleEvaluator]:
+        """
+        Get the compiled evaluator for a review rule.
+        
+        Evaluators are compiled on first use and recompiled only when the
+        rule is replaced (regenerated or reloaded from a changed file).
+        
+        Args:
+            review_rule: Review rule name
+            
+        Returns:
+            Evaluator function or None if the rule is unknown
+        """
+        rule = self.structured_rules.get(review_rule)
+        if rule is None:
+            logger.warning(f"No structured rule found for {review_rule}")
+            return None
+        
+        cached = self._evaluators.get(review_rule)
+        if cached is None or cached[0] is not rule:
+            cached = (rule, _compile_rule(rule))
+            self._evaluators[review_rule] = cached
+        
+        return cached[1]
+    
     def list_rules(self) -> List[str]:
         """
         List all available review rules.
@@ -399,15 +846,20 @@ JSON:"""
         """
         return list(self.structured_rules.keys())
     
-    def refresh_rules(self) -> Dict[str, Dict]:
+    def refresh_rules(self, force: bool = False) -> Dict[str, Dict]:
         """
         Re-generate structured rules from updated policies.
         
+        Only policies whose text changed are sent to the LLM.
+        
+        Args:
+            force: If True, regenerate every rule
+            
         Returns:
             Dictionary of newly generated rules
         """
         logger.info("Refreshing structured rules...")
-        return self.generate_structured_rules()
+        return self.generate_structured_rules(force=force)
     
     def get_stats(self) -> Dict:
         """
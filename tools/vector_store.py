@@ -4,17 +4,109 @@ Vector store implementation using ChromaDB for policy document storage and retri
 
 import chromadb
 from chromadb.config import Settings
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, NamedTuple, Optional, Tuple
+from functools import lru_cache
 import logging
 from pathlib import Path
 import hashlib
+import re
 
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_openai import OpenAIEmbeddings
-from config import settings
+from config import get_settings
+
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
 
 logger = logging.getLogger(__name__)
 
+# Zero-width match at the start of each policy section
+_POLICY_START_RE = re.compile(r'^(?=REVIEW_RULE:)', re.M)
+_REVIEW_RULE_RE = re.compile(r'^REVIEW_RULE:(.*)$', re.M)
+
+# Splitter for oversized policies; stateless, so one instance is shared
+_TEXT_SPLITTER = RecursiveCharacterTextSplitter(
+    chunk_size=1000,
+    chunk_overlap=100,
+    separators=["\n\n", "\n", " ", ""]
+)
+
+
+def _get_hasher(hash_algo: str) -> Callable[[str], str]:
+    """
+    Get a function returning a 128-bit hex digest of a text.
+    
+    Args:
+        hash_algo: "md5", "blake2b" or "xxh3"
+        
+    Returns:
+        Hash function producing 32-character hex IDs
+        
+    Raises:
+        ImportError: If "xxh3" is selected but xxhash is not installed
+    """
+    if hash_algo == "xxh3":
+        # No fallback: a different hash would silently re-ID every chunk
+        if not HAS_XXHASH:
+            raise ImportError("hash_algo 'xxh3' requires the xxhash package")
+        return lambda text: xxhash.xxh3_128_hexdigest(text.encode())
+    if hash_algo == "blake2b":
+        return lambda text: hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+    return lambda text: hashlib.md5(text.encode()).hexdigest()
+
+
+def _collection_metadata() -> Dict:
+    """Metadata for a new policy collection, including its HNSW index parameters."""
+    settings = get_settings()
+    return {
+        "description": "Underwriting policy documents",
+        "hnsw:space": settings.chroma_hnsw_space,
+        "hnsw:search_ef": settings.chroma_hnsw_search_ef,
+        "hnsw:construction_ef": settings.chroma_hnsw_construction_ef,
+        "hnsw:M": settings.chroma_hnsw_m
+    }
+
+
+def _chunk_position(metadata: Dict) -> Tuple[int, int]:
+    """Sort key placing a chunk at its position in the source policies."""
+    return (metadata.get('policy_index', 0), metadata.get('chunk_index', 0))
+
+
+def _split_policies(text: str) -> List[str]:
+    """
+    Split text into policy sections, each starting at a REVIEW_RULE: line.
+    
+    Text before the first marker is kept as its own section.
+    
+    Args:
+        text: Text containing one or more policies
+        
+    Returns:
+        List of policy sections
+    """
+    sections = _POLICY_START_RE.split(text)
+    if len(sections) > 1 and not sections[0]:
+        sections = sections[1:]
+    
+    # Drop the newline separating each section from the next marker
+    last = len(sections) - 1
+    return [
+        section[:-1] if idx < last and section.endswith('\n') else section
+        for idx, section in enumerate(sections)
+    ]
+
+
+class _PendingChunks(NamedTuple):
+    """Chunks of a policy load that are not yet in the collection."""
+    total_chunks: int  # Chunks the policies split into, including ones already stored
+    chunks: List[str]
+    ids: List[str]
+    metadatas: List[Dict]
+    unique_texts: Dict[str, str]  # Chunk texts to embed, keyed by content hash
+
 
 class PolicyVectorStore:
     """
@@ -29,8 +121,10 @@ class PolicyVectorStore:
             persist_directory: Directory to persist ChromaDB data
             collection_name: Name of the ChromaDB collection
         """
+        settings = get_settings()
         self.persist_directory = persist_directory or settings.chroma_persist_directory
         self.collection_name = collection_name or settings.chroma_collection_name
+        self._hash_text = _get_hasher(settings.hash_algo)
         
         # Ensure persist directory exists
         Path(self.persist_directory).mkdir(parents=True, exist_ok=True)
@@ -39,6 +133,11 @@ class PolicyVectorStore:
         self.client = None
         self.collection = None
         self.embeddings = None
+        self._embed_query: Optional[Callable[[str], List[float]]] = None
+        # Chunk IDs per upper-cased review rule, rebuilt from the collection when
+        # its document count no longer matches the count the index was built at
+        self._rule_index: Optional[Dict[str, List[str]]] = None
+        self._rule_index_count = 0
         
         logger.info(f"PolicyVectorStore initialized with persist_directory: {self.persist_directory}")
     
@@ -46,6 +145,7 @@ class PolicyVectorStore:
         """
         Initialize ChromaDB with persistent storage and embeddings.
         """
+        settings = get_settings()
         try:
             # Initialize ChromaDB client
             self.client = chromadb.PersistentClient(
@@ -56,16 +156,23 @@ class PolicyVectorStore:
                 )
             )
             
-            # Initialize OpenAI embeddings
+            # Initialize OpenAI embeddings; large batches keep requests per load to ceil(chunks / batch size)
             self.embeddings = OpenAIEmbeddings(
                 openai_api_key=settings.openai_api_key,
-                model="text-embedding-3-small"
+                model=settings.embedding_model,
+                chunk_size=settings.embedding_batch_size,
+                max_retries=settings.embedding_max_retries,
+                request_timeout=settings.embedding_request_timeout,
+                show_progress_bar=False
             )
             
-            # Get or create collection
+            # Repeated queries (e.g. the same review rule) reuse their embedding
+            self._embed_query = lru_cache(maxsize=settings.query_embedding_cache_size)(self.embeddings.embed_query)
+            
+            # Get or create collection (HNSW parameters only apply to a new collection)
             self.collection = self.client.get_or_create_collection(
                 name=self.collection_name,
-                metadata={"description": "Underwriting policy documents"}
+                metadata=_collection_metadata()
             )
             
             logger.info(f"ChromaDB initialized successfully. Collection: {self.collection_name}")
@@ -86,32 +193,13 @@ class PolicyVectorStore:
             List of text chunks
         """
         # Split by policy sections (REVIEW_RULE markers)
-        policies = []
-        current_policy = []
-        
-        for line in text.split('\n'):
-            if line.startswith('REVIEW_RULE:') and current_policy:
-                # Save previous policy
-                policies.append('\n'.join(current_policy))
-                current_policy = [line]
-            else:
-                current_policy.append(line)
-        
-        # Add the last policy
-        if current_policy:
-            policies.append('\n'.join(current_policy))
+        policies = _split_policies(text)
         
         # Further split if policies are too large
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=1000,
-            chunk_overlap=100,
-            separators=["\n\n", "\n", " ", ""]
-        )
-        
         final_chunks = []
         for policy in policies:
             if len(policy) > 1000:
-                chunks = text_splitter.split_text(policy)
+                chunks = _TEXT_SPLITTER.split_text(policy)
                 final_chunks.extend(chunks)
             else:
                 final_chunks.append(policy)
@@ -128,23 +216,18 @@ class PolicyVectorStore:
         Returns:
             Unique document ID
         """
-        return hashlib.md5(text.encode()).hexdigest()
+        return self._hash_text(text)
     
-    def load_policies(self, policy_texts: List[str]) -> Dict:
+    def _prepare_chunks(self, policy_texts: List[str]) -> Tuple[List[str], List[str], List[Dict]]:
         """
-        Embed and store policy documents in ChromaDB.
+        Split policy documents into chunks with their IDs and metadata.
         
         Args:
             policy_texts: List of policy document texts
             
         Returns:
-            Dictionary with loading statistics
+            Tuple of (chunks, ids, metadatas)
         """
-        if not self.collection:
-            raise RuntimeError("Database not initialized. Call initialize_db() first.")
-        
-        logger.info(f"Loading {len(policy_texts)} policy documents...")
-        
         all_chunks = []
         all_ids = []
         all_metadatas = []
@@ -154,11 +237,8 @@ class PolicyVectorStore:
             chunks = self._split_policy_text(policy_text)
             
             # Extract review rule name if present
-            review_rule = "UNKNOWN"
-            for line in policy_text.split('\n'):
-                if line.startswith('REVIEW_RULE:'):
-                    review_rule = line.replace('REVIEW_RULE:', '').strip()
-                    break
+            match = _REVIEW_RULE_RE.search(policy_text)
+            review_rule = match.group(1).strip() if match else "UNKNOWN"
             
             for chunk_idx, chunk in enumerate(chunks):
                 # Generate unique ID
@@ -176,26 +256,156 @@ class PolicyVectorStore:
                 all_ids.append(doc_id)
                 all_metadatas.append(metadata)
         
-        # Generate embeddings and add to collection
-        try:
-            embeddings_list = self.embeddings.embed_documents(all_chunks)
+        return all_chunks, all_ids, all_metadatas
+    
+    def _select_new_chunks(
+        self,
+        all_chunks: List[str],
+        all_ids: List[str],
+        all_metadatas: List[Dict]
+    ) -> Tuple[List[str], List[str], List[Dict], Dict[str, str]]:
+        """
+        Drop chunks already stored in ChromaDB and collect the unique texts to embed.
+        
+        Args:
+            all_chunks: Chunk texts
+            all_ids: Chunk IDs
+            all_metadatas: Chunk metadata
+            
+        Returns:
+            Tuple of (chunks, ids, metadatas) still to add, and the unique chunk
+            texts keyed by content hash
+        """
+        # IDs are content hashes, so chunks loaded before keep the same ID
+        existing_ids = set(self.collection.get(ids=all_ids, include=[])["ids"]) if all_ids else set()
+        
+        chunks, ids, metadatas = [], [], []
+        unique_texts = {}
+        for chunk, doc_id, metadata in zip(all_chunks, all_ids, all_metadatas):
+            if doc_id in existing_ids:
+                continue
+            chunks.append(chunk)
+            ids.append(doc_id)
+            metadatas.append(metadata)
+            unique_texts.setdefault(self._generate_doc_id(chunk), chunk)
+        
+        if existing_ids:
+            logger.info(f"Skipping {len(existing_ids)} chunks already in the collection")
+        
+        return chunks, ids, metadatas, unique_texts
+    
+    def _pending_chunks(self, policy_texts: List[str]) -> _PendingChunks:
+        """
+        Split policy documents into chunks and keep the ones still to be added.
+        
+        Args:
+            policy_texts: List of policy document texts
+            
+        Returns:
+            Chunks to add, with the unique chunk texts that need embeddings
+        """
+        all_chunks, all_ids, all_metadatas = self._prepare_chunks(policy_texts)
+        chunks, ids, metadatas, unique_texts = self._select_new_chunks(all_chunks, all_ids, all_metadatas)
+        return _PendingChunks(len(all_chunks), chunks, ids, metadatas, unique_texts)
+    
+    def _add_chunks(
+        self,
+        policy_texts: List[str],
+        pending: _PendingChunks,
+        embeddings_list: List[List[float]]
+    ) -> Dict:
+        """
+        Add embedded chunks to ChromaDB.
+        
+        Args:
+            policy_texts: Policy document texts the chunks came from
+            pending: Chunks to add
+            embeddings_list: Embeddings for pending.unique_texts, in order
             
-            # Add to ChromaDB
+        Returns:
+            Dictionary with loading statistics
+        """
+        chunks, ids, metadatas = pending.chunks, pending.ids, pending.metadatas
+        embeddings_by_hash = dict(zip(pending.unique_texts, embeddings_list))
+        if chunks:
             self.collection.add(
-                documents=all_chunks,
-                embeddings=embeddings_list,
-                metadatas=all_metadatas,
-                ids=all_ids
+                documents=chunks,
+                embeddings=[embeddings_by_hash[self._generate_doc_id(chunk)] for chunk in chunks],
+                metadatas=metadatas,
+                ids=ids
             )
+        
+        collection_count = self.collection.count()
+        
+        # Extend the index in place unless another writer changed the collection too
+        if chunks and self._rule_index is not None:
+            if collection_count == self._rule_index_count + len(chunks):
+                for doc_id, metadata in zip(ids, metadatas):
+                    self._rule_index.setdefault(metadata['review_rule'].upper(), []).append(doc_id)
+                self._rule_index_count = collection_count
+            else:
+                self._rule_index = None
+        
+        stats = {
+            "total_policies": len(policy_texts),
+            "total_chunks": pending.total_chunks,
+            "new_chunks": len(chunks),
+            "embedded_chunks": len(embeddings_by_hash),
+            "collection_count": collection_count
+        }
+        
+        logger.info(f"Successfully loaded policies: {stats}")
+        return stats
+    
+    def load_policies(self, policy_texts: List[str]) -> Dict:
+        """
+        Embed and store policy documents in ChromaDB.
+        
+        Chunks already in the collection are skipped, and identical chunk
+        texts are embedded once.
+        
+        Args:
+            policy_texts: List of policy document texts
             
-            stats = {
-                "total_policies": len(policy_texts),
-                "total_chunks": len(all_chunks),
-                "collection_count": self.collection.count()
-            }
+        Returns:
+            Dictionary with loading statistics
+        """
+        if not self.collection:
+            raise RuntimeError("Database not initialized. Call initialize_db() first.")
+        
+        logger.info(f"Loading {len(policy_texts)} policy documents...")
+        
+        # Generate embeddings and add to collection
+        try:
+            pending = self._pending_chunks(policy_texts)
+            texts = list(pending.unique_texts.values())
+            embeddings_list = self.embeddings.embed_documents(texts) if texts else []
+            return self._add_chunks(policy_texts, pending, embeddings_list)
             
-            logger.info(f"Successfully loaded policies: {stats}")
-            return stats
+        except Exception as e:
+            logger.error(f"Error loading policies: {e}")
+            raise
+    
+    async def aload_policies(self, policy_texts: List[str]) -> Dict:
+        """
+        Async variant of load_policies that awaits the embedding requests.
+        
+        Args:
+            policy_texts: List of policy document texts
+            
+        Returns:
+            Dictionary with loading statistics
+        """
+        if not self.collection:
+            raise RuntimeError("Database not initialized. Call initialize_db() first.")
+        
+        logger.info(f"Loading {len(policy_texts)} policy documents...")
+        
+        try:
+            pending = self._pending_chunks(policy_texts)
+            texts = list(pending.unique_texts.values())
+            embeddings_list = await self.embeddings.aembed_documents(texts) if texts else []
+            return self._add_chunks(policy_texts, pending, embeddings_list)
             
         except Exception as e:
             logger.error(f"Error loading policies: {e}")
@@ -216,20 +426,7 @@ class PolicyVectorStore:
                 content = f.read()
             
             # Split into individual policies by REVIEW_RULE markers
-            policy_texts = []
-            current_policy = []
-            
-            for line in content.split('\n'):
-                if line.startswith('REVIEW_RULE:') and current_policy:
-                    # Save previous policy
-                    policy_texts.append('\n'.join(current_policy))
-                    current_policy = [line]
-                else:
-                    current_policy.append(line)
-            
-            # Add the last policy
-            if current_policy:
-                policy_texts.append('\n'.join(current_policy))
+            policy_texts = _split_policies(content)
             
             logger.info(f"Split file into {len(policy_texts)} separate policies")
             
@@ -255,7 +452,7 @@ class PolicyVectorStore:
         
         try:
             # Generate embedding for the query
-            query_embedding = self.embeddings.embed_query(review_rule)
+            query_embedding = self._embed_query(review_rule)
             
             # Query ChromaDB
             results = self.collection.query(
@@ -293,19 +490,78 @@ class PolicyVectorStore:
         Returns:
             Complete policy document or None if not found
         """
-        results = self.query_policy(review_rule, top_k=5)
+        if not self.collection:
+            raise RuntimeError("Database not initialized. Call initialize_db() first.")
+        
+        # Exact lookup by chunk ID; no query embedding needed
+        chunk_ids = self._get_rule_index().get(review_rule.upper())
+        if not chunk_ids:
+            return None
+        
+        results = self.collection.get(ids=chunk_ids, include=["documents", "metadatas"])
+        if not results['documents']:
+            return None
+        
+        # Combine all chunks from the same policy, in order
+        chunks = sorted(zip(results['metadatas'], results['documents']), key=lambda item: _chunk_position(item[0]))
+        return '\n'.join(document for _, document in chunks)
+    
+    def _get_rule_index(self) -> Dict[str, List[str]]:
+        """
+        Get the chunk IDs for each review rule.
+        
+        The index is rebuilt with one collection read whenever the collection's
+        document count changes, e.g. after another client added policies.
+        
+        Returns:
+            Dictionary of chunk IDs keyed by upper-cased review rule
+        """
+        count = self.collection.count()
+        if self._rule_index is None or count != self._rule_index_count:
+            all_docs = self.collection.get(include=["metadatas"])
+            
+            rule_index: Dict[str, List[str]] = {}
+            for doc_id, metadata in zip(all_docs['ids'], all_docs['metadatas'] or []):
+                if metadata and 'review_rule' in metadata:
+                    rule_index.setdefault(metadata['review_rule'].upper(), []).append(doc_id)
+            
+            self._rule_index = rule_index
+            self._rule_index_count = len(all_docs['ids'])
         
-        # Filter results that match the review rule
-        matching_results = [
-            r for r in results 
-            if r['metadata'].get('review_rule', '').upper() == review_rule.upper()
-        ]
+        return self._rule_index
+    
+    def dump_policies_by_rule(self) -> Dict[str, str]:
+        """
+        Get the complete policy text for every review rule with one collection read.
         
-        if matching_results:
-            # Combine all chunks from the same policy
-            return '\n'.join([r['document'] for r in matching_results])
+        Unlike get_policy_by_rule, which looks up one rule's chunks by ID, this
+        reads every policy at once and returns each one's chunks in chunk order.
         
-        return None
+        Returns:
+            Dictionary of policy text keyed by review rule, sorted by rule name
+        """
+        if not self.collection:
+            raise RuntimeError("Database not initialized. Call initialize_db() first.")
+        
+        try:
+            all_docs = self.collection.get(include=["documents", "metadatas"])
+            
+            # Group chunks by review rule, keeping their position for ordering
+            chunks_by_rule: Dict[str, List[Tuple[Tuple[int, int], str]]] = {}
+            for document, metadata in zip(all_docs['documents'] or [], all_docs['metadatas'] or []):
+                review_rule = metadata.get('review_rule')
+                if review_rule is None:
+                    continue
+                chunks_by_rule.setdefault(review_rule, []).append((_chunk_position(metadata), document))
+            
+            return {
+                review_rule: '\n'.join(document for _, document in sorted(chunks_by_rule[review_rule]))
+                for review_rule in sorted(chunks_by_rule)
+            }
+            
+        except Exception as e:
+            logger.error(f"Error reading policies: {e}")
+            raise
     
     def list_all_policies(self) -> List[str]:
         """
@@ -342,8 +598,10 @@ class PolicyVectorStore:
             self.client.delete_collection(name=self.collection_name)
             self.collection = self.client.create_collection(
                 name=self.collection_name,
-                metadata={"description": "Underwriting policy documents"}
+                metadata=_collection_metadata()
             )
+            self._rule_index = {}
+            self._rule_index_count = 0
             logger.info(f"Collection '{self.collection_name}' reset successfully")
     
     def get_stats(self) -> Dict: